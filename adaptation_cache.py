@@ -0,0 +1,151 @@
+"""
+Adaptation Cache
+Keeps ContentAdapter output for unchanged content, in memory and under content_data
+"""
+
+import copy
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+# Content fields the adapt_for_* methods read; output can only change when
+# one of these, the platform, the options or ADAPTER_VERSION changes
+ADAPTATION_INPUT_FIELDS = [
+    "title", "content_long", "content_summary", "meta_description", "tags", "canonical_url", "author"
+]
+
+# Entries stored for content objects without a content_id
+UNSAVED_CONTENT = "_unsaved"
+
+
+def content_fingerprint(content: Dict) -> str:
+    """SHA-256 of the fields adaptation reads"""
+    inputs = {field: content.get(field) for field in ADAPTATION_INPUT_FIELDS}
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def cache_key(fingerprint: str, platform: str, version: int, options: Optional[Dict] = None) -> str:
+    """Cache key of one adaptation"""
+    key = json.dumps([fingerprint, platform, version, options or {}], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class AdaptationCache:
+    """
+    Two-tier cache of adapted content
+
+    Entries live in an in-memory LRU and as JSON files under
+    root/<content_id>/, so they survive restarts and are shared between
+    processes. Keys are built with cache_key(), so edited content simply
+    misses; invalidate() drops a record's entries once they can no longer
+    be hit.
+    """
+
+    def __init__(self, root: Path, max_entries: int = 256):
+        self.root = Path(root)
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, content_id: Optional[str], key: str):
+        """
+        Look up an adaptation
+
+        Returns:
+            A copy of the cached result, or None on a miss
+        """
+        content_id = content_id or UNSAVED_CONTENT
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(entry[1])
+
+        try:
+            with open(self._path(content_id, key), 'r', encoding='utf-8') as f:
+                value = json.load(f)["result"]
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._disk_hits += 1
+            self._remember(content_id, key, value)
+        return copy.deepcopy(value)
+
+    def put(self, content_id: Optional[str], key: str, platform: str, value):
+        """Store an adaptation in both tiers"""
+        content_id = content_id or UNSAVED_CONTENT
+        path = self._path(content_id, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # A cache file needs no fsync: a torn or missing one is just a miss
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"platform": platform, "result": value}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+        with self._lock:
+            self._remember(content_id, key, copy.deepcopy(value))
+
+    def invalidate(self, content_id: str):
+        """Drop every cached adaptation of a content item"""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[0] == content_id]:
+                del self._entries[key]
+        shutil.rmtree(self.root / content_id, ignore_errors=True)
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._disk_hits = self._misses = self._evictions = 0
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def cache_info(self) -> Dict:
+        """
+        Get cache counters
+
+        Returns:
+            Memory hits, disk hits, misses, evictions, hit rate (both tiers),
+            current size and maximum size of the memory tier
+        """
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_entries
+            }
+
+    def _remember(self, content_id: str, key: str, value):
+        """Add to the memory tier, evicting the least recently used entries"""
+        self._entries[key] = (content_id, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _path(self, content_id: str, key: str) -> Path:
+        return self.root / content_id / f"{key}.json"
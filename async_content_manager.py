@@ -0,0 +1,195 @@
+"""
+Async Content Management API
+Runs ContentManager file I/O on a bounded thread pool so asyncio workers never block
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from content_manager import ContentManager
+
+
+class AsyncContentManager:
+    """
+    Asyncio front end for ContentManager
+
+    Every method mirrors a ContentManager method with an "a" prefix and runs
+    it on a private thread pool. Record locks and revisions make concurrent
+    calls on the same record safe, and the pool size bounds how many file
+    operations are in flight at once.
+
+    Example:
+        async with AsyncContentManager() as manager:
+            contents = await manager.aget_many(content_ids)
+    """
+
+    def __init__(
+        self,
+        base_dir: str = "content_data",
+        max_workers: int = 8,
+        manager: Optional[ContentManager] = None
+    ):
+        self.manager = manager or ContentManager(base_dir)
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="content-io")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Shut down the thread pool"""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, fn, *args, **kwargs):
+        """Run a blocking ContentManager call on the pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def acreate_content(self, *args, **kwargs) -> Dict:
+        """Async create_content"""
+        return await self._run(self.manager.create_content, *args, **kwargs)
+
+    async def aget_content(self, content_id: str, include_body: bool = True) -> Optional[Dict]:
+        """Async get_content"""
+        return await self._run(self.manager.get_content, content_id, include_body=include_body)
+
+    async def aget_many(self, content_ids: Iterable[str], include_body: bool = True) -> List[Optional[Dict]]:
+        """
+        Load many records concurrently
+
+        Args:
+            content_ids: IDs to load
+            include_body: Read content_long now, or lazily on access
+
+        Returns:
+            Content objects (None for missing IDs) in the order requested
+        """
+        # Bound queued work so huge batches don't flood the executor queue
+        inflight = asyncio.Semaphore(self.max_workers * 2)
+
+        async def load(content_id: str):
+            async with inflight:
+                return await self.aget_content(content_id, include_body=include_body)
+
+        return await asyncio.gather(*(load(content_id) for content_id in content_ids))
+
+    async def alist_content(self, status: Optional[str] = None, include_body: bool = True) -> List[Dict]:
+        """Async list_content"""
+        return await self._run(self.manager.list_content, status, include_body=include_body)
+
+    async def aiter_content(self, status: Optional[str] = None, category: Optional[str] = None,
+                            since: Optional[Union[str, datetime]] = None, limit: Optional[int] = None,
+                            cursor: Optional[str] = None, include_body: bool = True,
+                            page_size: int = 100) -> AsyncIterator[Dict]:
+        """
+        Async iter_content, fetching one page of records per pool call
+
+        Args:
+            status: Filter by status ("draft" or "published")
+            category: Filter by category
+            since: Only content modified at or after this time (ISO string or datetime)
+            limit: Maximum number of records to yield
+            cursor: Continue after the record this cursor was taken from
+            include_body: Read content_long on the pool; when False records
+                come without content_long, so nothing reads the disk later
+                on the event loop
+            page_size: Records loaded per round trip to the pool
+
+        Yields:
+            Content objects, newest first
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = await self._run(self._read_page, status, category, since, size, cursor, include_body)
+            for content in page:
+                yield content
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < size:
+                return
+            cursor = self.manager.page_cursor(page[-1])
+
+    def _read_page(self, status: Optional[str], category: Optional[str], since, limit: int,
+                   cursor: Optional[str], include_body: bool) -> List[Dict]:
+        """Read one aiter_content page completely on a pool thread"""
+        page = self.manager.iter_content(status=status, category=category, since=since,
+                                         limit=limit, cursor=cursor, include_body=include_body)
+        if include_body:
+            return list(page)
+        # dict.items() leaves out a body that was never read, and with it the loader
+        return [dict(dict.items(content)) for content in page]
+
+    async def alist_metadata(self, status: Optional[str] = None) -> List[Dict]:
+        """Async list_metadata"""
+        return await self._run(self.manager.list_metadata, status)
+
+    async def aupdate_content(self, content_id: str, updates: Dict,
+                              expected_revision: Optional[int] = None) -> Dict:
+        """Async update_content"""
+        return await self._run(self.manager.update_content, content_id, updates,
+                               expected_revision=expected_revision)
+
+    async def asave(self, content: Dict) -> Dict:
+        """
+        Save a content object that was read and modified by the caller
+
+        The edits go through update_content, so the slug, summary, modified
+        date and (after a status change) the record's directory are kept
+        in step exactly as for a direct update.
+
+        Args:
+            content: Content object from aget_content, with edits applied
+
+        Returns:
+            The saved content at its new revision
+
+        Raises:
+            RevisionConflictError: If the record changed since it was read
+        """
+        return await self._run(self._save, content)
+
+    def _save(self, content: Dict) -> Dict:
+        """Apply the fields the caller changed through update_content; runs on a pool thread"""
+        content_id = content["content_id"]
+        stored = self.manager.get_content(content_id, include_body=False)
+        if stored is None:
+            raise ValueError(f"Content with ID {content_id} not found")
+
+        # An unread lazy body was not edited, and dict.items() skips it
+        updates = {
+            key: value for key, value in dict.items(content)
+            if key not in ("content_id", "created_date", "modified_date", "revision") and stored.get(key) != value
+        }
+        return self.manager.update_content(content_id, updates, expected_revision=content.get("revision", 0))
+
+    async def apublish_content(self, content_id: str, canonical_url: str) -> Dict:
+        """Async publish_content"""
+        return await self._run(self.manager.publish_content, content_id, canonical_url)
+
+    async def adelete_content(self, content_id: str) -> bool:
+        """Async delete_content"""
+        return await self._run(self.manager.delete_content, content_id)
+
+    async def aupdate_syndication_status(self, content_id: str, platform: str, status: str,
+                                         url: Optional[str] = None, error: Optional[str] = None) -> Dict:
+        """Async update_syndication_status"""
+        return await self._run(self.manager.update_syndication_status, content_id, platform, status, url, error)
+
+    async def abulk_update_syndication_status(self, updates: Iterable[tuple]) -> Dict[str, Dict]:
+        """Async bulk_update_syndication_status"""
+        return await self._run(self.manager.bulk_update_syndication_status, list(updates))
+
+    async def aget_by_slug(self, slug: str, include_body: bool = True) -> Optional[Dict]:
+        """Async get_by_slug"""
+        return await self._run(self.manager.get_by_slug, slug, include_body=include_body)
+
+    async def aget_stats(self, refresh: bool = False) -> Dict:
+        """Async get_stats"""
+        return await self._run(self.manager.get_stats, refresh)
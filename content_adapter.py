@@ -3,14 +3,158 @@ Content Adaptation Engine
 Transforms long-form content for different platforms with specific formatting rules
 """
 
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice, repeat
+from typing import Dict, Iterator, List, Optional, Union
+import hashlib
 import re
+import threading
+
+from adaptation_cache import AdaptationCache, cache_key, content_fingerprint
+from text_processing import iter_sentences
+
+# Bump whenever a change alters adapt_for_* output, so cached adaptations are not reused
+ADAPTER_VERSION = 3
+
+# Lines that count as key points: numbered list items and ## headings
+KEY_POINT_LINE = re.compile(r'^\d+\.|\*\*\d+\.|##')
+KEY_POINT_CLEAN = re.compile(r'[#*\d\.]')
+
+HOOK_CLEAN = re.compile(r'[#*`]')
+PARAGRAPH_BREAK = re.compile(r'\n[ \t]*\n')
+WORD = re.compile(r'\S+')
+
+# Where _shorten_content may cut: the end of a sentence (with any closing
+# quote, bracket or emphasis marker) or a paragraph break
+SENTENCE_BOUNDARY = re.compile(r'[.!?]["\')\]*_]*(?=\s|$)')
+# A "sentence" that is only an ordered list marker ("3.", "**3.**") is not one
+LIST_MARKER = re.compile(r'[ \t>]*[*_]*\d+\.[*_]*')
+FENCE_LINE = re.compile(r'^[ \t]*```', re.MULTILINE)
+
+# Platforms adapt_all() produces by default, each named after its adapt_for_* method
+PLATFORMS = [
+    "medium",
+    "devto",
+    "linkedin_article",
+    "linkedin_post",
+    "twitter_thread",
+    "reddit",
+    "quora",
+    "substack",
+    "youtube_description",
+]
+
+
+class ParsedDocument:
+    """
+    Structure of one content body, extracted in a single pass
+    
+    Built by ContentAdapter.parse() and shared by every adapt_for_* method,
+    so fanning one article out to all platforms tokenizes it once.
+    
+    Attributes:
+        text: The original body
+        digest: SHA-256 of the body, the parse cache key
+        key_points: Cleaned lines that are numbered items or ## headings,
+            at most 100 characters each
+        sentences: Stripped sentences longer than 30 characters (split
+            lazily: key_point() and iter_key_points() only split as far
+            as the points they return)
+        hook: First line with over 50 characters of text, at most 200
+    """
+    
+    def __init__(self, text: str, digest: str):
+        self.text = text
+        self.digest = digest
+        self.key_points: List[str] = []
+        self.hook = ""
+        
+        for line in text.split('\n'):
+            if KEY_POINT_LINE.match(line.strip()):
+                self.key_points.append(KEY_POINT_CLEAN.sub('', line).strip()[:100])
+            if not self.hook:
+                clean_line = HOOK_CLEAN.sub('', line).strip()
+                if len(clean_line) > 50:
+                    self.hook = clean_line[:200]
+        
+        self._sentences: List[str] = []
+        self._pending_sentences: Optional[Iterator[str]] = iter_sentences(text)
+        self._sentences_lock = threading.Lock()
+    
+    @property
+    def sentences(self) -> List[str]:
+        """Every sentence longer than 30 characters"""
+        return self._sentences_upto(None)
+    
+    def _sentences_upto(self, count: Optional[int]) -> List[str]:
+        """Split sentences until count are known (or the body ends)"""
+        with self._sentences_lock:
+            while self._pending_sentences is not None and (count is None or len(self._sentences) < count):
+                piece = next(self._pending_sentences, None)
+                if piece is None:
+                    self._pending_sentences = None
+                    break
+                piece = piece.strip()
+                if len(piece) > 30:
+                    self._sentences.append(piece)
+        return self._sentences
+    
+    def key_point(self, point_number: int) -> str:
+        """
+        The Nth key point (1-based)
+        
+        Numbered items and ## headings come first; past those, the Nth
+        sentence stands in, and past the sentences a generic line.
+        """
+        if point_number <= len(self.key_points):
+            return self.key_points[point_number - 1]
+        sentences = self._sentences_upto(point_number)
+        if point_number <= len(sentences):
+            return sentences[point_number - 1][:100]
+        return "Key insight from the article"
+    
+    def iter_key_points(self) -> Iterator[str]:
+        """
+        Yield key_point(1), key_point(2), ... in one pass
+        
+        Ends after the generic line, which is all key_point() returns
+        past the last sentence.
+        """
+        yield from self.key_points
+        point_number = len(self.key_points)
+        while True:
+            point_number += 1
+            sentences = self._sentences_upto(point_number)
+            if point_number > len(sentences):
+                break
+            yield sentences[point_number - 1][:100]
+        yield "Key insight from the article"
+
+
+@lru_cache(maxsize=16)
+def _first_words_pattern(count: int) -> "re.Pattern":
+    """Regex matching from the start of a text to the end of its count-th word"""
+    return re.compile(r'\s*(?:\S+\s+){%d}\S+' % (count - 1))
+
+
+def _adapt_chunk(contents: List[Dict], platforms: Optional[List[str]],
+                 options: Optional[Dict[str, Dict]]) -> List[Dict[str, object]]:
+    """
+    Adapt a chunk of content for adapt_many()
+    
+    Runs in worker processes, so it builds its own adapter; the parse
+    cache is per chunk, which is all adapt_all() needs.
+    """
+    adapter = ContentAdapter()
+    return [adapter.adapt_all(content, platforms, options) for content in contents]
 
 
 class ContentAdapter:
     """Adapts content for different distribution platforms"""
     
-    def __init__(self):
+    def __init__(self, document_cache_size: int = 64, cache: Optional[AdaptationCache] = None):
         self.platform_limits = {
             "twitter": 280,
             "linkedin_post": 1300,
@@ -20,6 +164,198 @@ class ContentAdapter:
             "reddit": 10000,
             "quora": 5000
         }
+        
+        # Parsed bodies by digest, most recently used last
+        self.document_cache_size = document_cache_size
+        self._documents: "OrderedDict[str, ParsedDocument]" = OrderedDict()
+        self._documents_lock = threading.Lock()
+        
+        # Adapted output of adapt()/adapt_all()/adapt_many(), if given
+        # (ContentManager.adaptations invalidates it on edits)
+        self.cache = cache
+    
+    def parse(self, content: Union[str, Dict, ParsedDocument]) -> ParsedDocument:
+        """
+        Parse a content body, or return the cached parse of an identical one
+        
+        Args:
+            content: Body text, content object, or an already parsed document
+            
+        Returns:
+            ParsedDocument for the body
+        """
+        if isinstance(content, ParsedDocument):
+            return content
+        text = content['content_long'] if isinstance(content, dict) else content
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        
+        with self._documents_lock:
+            document = self._documents.get(digest)
+            if document is not None:
+                self._documents.move_to_end(digest)
+                return document
+        
+        document = ParsedDocument(text, digest)
+        with self._documents_lock:
+            self._documents[digest] = document
+            while len(self._documents) > self.document_cache_size:
+                self._documents.popitem(last=False)
+        return document
+    
+    def adapt(self, content: Dict, platform: str, **options) -> object:
+        """
+        Adapt content for one platform, through the cache if there is one
+        
+        Args:
+            content: Original content object
+            platform: Platform name from PLATFORMS
+            **options: Extra keyword arguments for the adapt_for_* method
+            
+        Returns:
+            That adapt_for_* method's result
+            
+        Raises:
+            ValueError: If the platform is not in PLATFORMS
+        """
+        if platform not in PLATFORMS:
+            raise ValueError(f"Unknown platform '{platform}', expected one of {PLATFORMS}")
+        fingerprint = content_fingerprint(content) if self.cache is not None else None
+        return self._adapt(content, platform, options, fingerprint)
+    
+    def _adapt(self, content: Dict, platform: str, options: Dict, fingerprint: Optional[str]) -> object:
+        """adapt() with the content fingerprint already computed"""
+        options = self._platform_options(content, platform, options)
+        
+        if self.cache is None:
+            return getattr(self, f"adapt_for_{platform}")(content, **options)
+        
+        key = cache_key(fingerprint, platform, ADAPTER_VERSION, options)
+        result = self.cache.get(content.get("content_id"), key)
+        if result is None:
+            result = getattr(self, f"adapt_for_{platform}")(content, **options)
+            self.cache.put(content.get("content_id"), key, platform, result)
+        return result
+    
+    def _platform_options(self, content: Dict, platform: str, options: Dict) -> Dict:
+        """Keyword arguments for one adapt_for_* call, with defaults filled in"""
+        options = dict(options)
+        if platform == "quora":
+            options.setdefault("question", content["title"])
+        return options
+    
+    def adapt_all(self, content: Dict, platforms: Optional[List[str]] = None,
+                  options: Optional[Dict[str, Dict]] = None) -> Dict[str, object]:
+        """
+        Adapt content for several platforms at once
+        
+        The body is parsed at most once and every platform reuses the
+        parse; with a cache, platforms whose output is cached skip it.
+        
+        Args:
+            content: Original content object
+            platforms: Platform names from PLATFORMS (default: all of them)
+            options: Extra keyword arguments per platform, e.g.
+                {"reddit": {"subreddit": "smallbusiness"},
+                 "quora": {"question": "..."}}; the Quora question
+                defaults to the content title
+            
+        Returns:
+            Dict of platform name -> that adapt_for_* method's result
+            
+        Raises:
+            ValueError: If a platform is not in PLATFORMS
+        """
+        platforms = PLATFORMS if platforms is None else platforms
+        options = options or {}
+        unknown = [platform for platform in platforms if platform not in PLATFORMS]
+        if unknown:
+            raise ValueError(f"Unknown platforms {unknown}, expected some of {PLATFORMS}")
+        
+        fingerprint = content_fingerprint(content) if self.cache is not None else None
+        return {
+            platform: self._adapt(content, platform, options.get(platform, {}), fingerprint)
+            for platform in platforms
+        }
+    
+    def adapt_many(
+        self,
+        contents: List[Dict],
+        platforms: Optional[List[str]] = None,
+        options: Optional[Dict[str, Dict]] = None,
+        workers: int = 1,
+        use_processes: bool = True,
+        chunk_size: int = 16
+    ) -> List[Dict[str, object]]:
+        """
+        Run adapt_all() over a corpus
+        
+        Adaptation is CPU-bound, so with workers > 1 the contents are split
+        into chunks of chunk_size and adapted on a process pool; a chunk per
+        task keeps the cost of shipping contents to workers small next to
+        the work done on them. With a cache, contents whose every platform
+        is cached are not sent to workers, and worker results are cached.
+        
+        Args:
+            contents: Content objects (lazily loaded bodies are read here)
+            platforms: Platform names from PLATFORMS (default: all of them)
+            options: Extra keyword arguments per platform, as for adapt_all()
+            workers: Worker count; 1 adapts in this process
+            use_processes: Use processes (True) or threads (False) for workers
+            chunk_size: Contents per task sent to a worker
+            
+        Returns:
+            adapt_all() results, in the order of contents
+        """
+        if workers <= 1 or len(contents) <= chunk_size:
+            return [self.adapt_all(content, platforms, options) for content in contents]
+        
+        results: List[Optional[Dict[str, object]]] = [None] * len(contents)
+        pending = list(range(len(contents)))
+        if self.cache is not None:
+            # Workers have no cache, so only contents with a miss are sent out
+            pending = []
+            for index, content in enumerate(contents):
+                cached = self._cached_all(content, platforms, options)
+                if cached is None:
+                    pending.append(index)
+                else:
+                    results[index] = cached
+        
+        # Plain dicts with bodies loaded, so they can be pickled
+        work = [dict(contents[index], content_long=contents[index]["content_long"]) for index in pending]
+        chunks = [work[i:i + chunk_size] for i in range(0, len(work), chunk_size)]
+        
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=workers) as executor:
+            adapted = executor.map(_adapt_chunk, chunks, repeat(platforms), repeat(options))
+            for index, result in zip(pending, (result for chunk in adapted for result in chunk)):
+                results[index] = result
+                if self.cache is not None:
+                    self._store_all(contents[index], result, options)
+        return results
+    
+    def _cached_all(self, content: Dict, platforms: Optional[List[str]],
+                    options: Optional[Dict[str, Dict]]) -> Optional[Dict[str, object]]:
+        """adapt_all() from the cache alone, or None if any platform misses"""
+        fingerprint = content_fingerprint(content)
+        results = {}
+        for platform in PLATFORMS if platforms is None else platforms:
+            platform_options = self._platform_options(content, platform, (options or {}).get(platform, {}))
+            result = self.cache.get(
+                content.get("content_id"), cache_key(fingerprint, platform, ADAPTER_VERSION, platform_options)
+            )
+            if result is None:
+                return None
+            results[platform] = result
+        return results
+    
+    def _store_all(self, content: Dict, results: Dict[str, object], options: Optional[Dict[str, Dict]]):
+        """Cache adapt_all() results computed elsewhere"""
+        fingerprint = content_fingerprint(content)
+        for platform, result in results.items():
+            platform_options = self._platform_options(content, platform, (options or {}).get(platform, {}))
+            key = cache_key(fingerprint, platform, ADAPTER_VERSION, platform_options)
+            self.cache.put(content.get("content_id"), key, platform, result)
     
     def adapt_for_medium(self, content: Dict) -> Dict:
         """
@@ -130,23 +466,19 @@ canonical_url: {canonical_url}
         """
         canonical_url = content.get("canonical_url", "")
         
-        # Extract hook from first paragraph
-        lines = content['content_long'].split('\n')
-        hook = ""
-        for line in lines:
-            clean_line = re.sub(r'[#*`]', '', line).strip()
-            if len(clean_line) > 50:
-                hook = clean_line[:200]
-                break
+        document = self.parse(content)
+        
+        # Hook is the first substantial line
+        hook = document.hook
         
         # Create engaging LinkedIn post
         post = f"""🚀 {hook}
 
 Here's what you need to know:
 
-✅ {self._extract_key_point(content['content_long'], 1)}
-✅ {self._extract_key_point(content['content_long'], 2)}
-✅ {self._extract_key_point(content['content_long'], 3)}
+✅ {self._extract_key_point(document, 1)}
+✅ {self._extract_key_point(document, 2)}
+✅ {self._extract_key_point(document, 3)}
 
 💡 Want the full breakdown?
 Read the complete guide: {canonical_url}
@@ -182,7 +514,7 @@ Read the complete guide: {canonical_url}
         tweets.append(hook[:280])
         
         # Extract key points from content
-        key_points = self._extract_all_key_points(content['content_long'], max_points=8)
+        key_points = self._extract_all_key_points(self.parse(content), max_points=8)
         
         # Tweet 2-9: Key points
         for i, point in enumerate(key_points, 1):
@@ -245,16 +577,17 @@ Read the complete guide: {canonical_url}
             Adapted Quora answer
         """
         canonical_url = content.get("canonical_url", "")
+        document = self.parse(content)
         
         # Format as answer to question
         answer = f"""**Short answer:** {content['content_summary']}
 
 **Detailed explanation:**
 
-{self._shorten_content(content['content_long'], target_words=800)}
+{self._shorten_content(document, target_words=800)}
 
 **Key takeaways:**
-{self._create_bullet_summary(content['content_long'])}
+{self._create_bullet_summary(document)}
 
 ---
 
@@ -314,6 +647,7 @@ Best,
             YouTube description and suggested script outline
         """
         canonical_url = content.get("canonical_url", "")
+        document = self.parse(content)
         
         description = f"""{content['meta_description']}
 
@@ -321,9 +655,9 @@ Best,
 
 📌 TIMESTAMPS
 0:00 - Introduction
-0:30 - {self._extract_key_point(content['content_long'], 1)}
-2:00 - {self._extract_key_point(content['content_long'], 2)}
-4:00 - {self._extract_key_point(content['content_long'], 3)}
+0:30 - {self._extract_key_point(document, 1)}
+2:00 - {self._extract_key_point(document, 2)}
+4:00 - {self._extract_key_point(document, 3)}
 6:00 - Key Takeaways
 
 🔗 RESOURCES
@@ -338,54 +672,67 @@ Website: 57seconds.com
         return {
             "title": content['title'],
             "description": description,
-            "script_outline": self._create_video_script_outline(content)
+            "script_outline": self._create_video_script_outline(content, document)
         }
     
     # Helper methods
     
-    def _shorten_content(self, content: str, target_words: int) -> str:
-        """Intelligently shorten content to target word count"""
-        words = content.split()
-        if len(words) <= target_words:
-            return content
-        
-        # Try to find a natural break point near target
-        shortened = ' '.join(words[:target_words])
-        
-        # Find last complete sentence
-        last_period = shortened.rfind('.')
-        if last_period > len(shortened) * 0.8:  # If close to end
-            return shortened[:last_period + 1]
-        
-        return shortened + "..."
+    def _shorten_content(self, content: Union[str, ParsedDocument], target_words: int) -> str:
+        """
+        Shorten content to about target_words words
+        
+        Words are counted only up to the target, and the result is a slice
+        of the original text, so markdown line breaks, lists and code
+        blocks keep their formatting. The cut goes at the last sentence end
+        (an ordered list number like "3." does not count) or paragraph
+        break in the final fifth of the slice; without one,
+        the slice ends mid-sentence with "...". A code block left open by
+        the cut is closed.
+        """
+        text = content.text if isinstance(content, ParsedDocument) else content
+        if target_words < 1:
+            return text
+        
+        # One regex match runs to the end of the target word in C code
+        # rather than iterating over words one at a time
+        match = _first_words_pattern(target_words).match(text)
+        if match is None or WORD.search(text, match.end()) is None:
+            return text
+        
+        shortened = match.group()
+        
+        # Find the last natural break point, if it is close to the end
+        cut = 0
+        for match in SENTENCE_BOUNDARY.finditer(shortened, int(len(shortened) * 0.8)):
+            line_start = shortened.rfind("\n", 0, match.start()) + 1
+            if not LIST_MARKER.fullmatch(shortened, line_start, match.end()):
+                cut = match.end()
+        for match in PARAGRAPH_BREAK.finditer(shortened, int(len(shortened) * 0.8)):
+            cut = max(cut, match.start())
+        if cut:
+            shortened = shortened[:cut].rstrip()
+            ellipsis = ""
+        else:
+            shortened = shortened.rstrip()
+            ellipsis = "..."
+        
+        if len(FENCE_LINE.findall(shortened)) % 2:
+            shortened += "\n```"
+            ellipsis = ellipsis and "\n\n" + ellipsis
+        return shortened + ellipsis
     
-    def _extract_key_point(self, content: str, point_number: int) -> str:
+    def _extract_key_point(self, content: Union[str, ParsedDocument], point_number: int) -> str:
         """Extract a key point from content"""
-        # Simple extraction - look for numbered lists or headers
-        lines = content.split('\n')
-        points_found = 0
-        
-        for line in lines:
-            # Check for numbered lists or key indicators
-            if re.match(r'^\d+\.|\*\*\d+\.|##', line.strip()):
-                points_found += 1
-                if points_found == point_number:
-                    clean = re.sub(r'[#*\d\.]', '', line).strip()
-                    return clean[:100] if len(clean) > 100 else clean
-        
-        # Fallback: extract sentences
-        sentences = [s.strip() for s in re.split(r'[.!?]', content) if len(s.strip()) > 30]
-        if point_number <= len(sentences):
-            return sentences[point_number - 1][:100]
-        
-        return "Key insight from the article"
+        # Numbered lists and headers first, then sentences
+        return self.parse(content).key_point(point_number)
     
-    def _extract_all_key_points(self, content: str, max_points: int = 8) -> List[str]:
+    def _extract_all_key_points(self, content: Union[str, ParsedDocument], max_points: int = 8) -> List[str]:
         """Extract multiple key points from content"""
         points = []
-        for i in range(1, max_points + 1):
-            point = self._extract_key_point(content, i)
-            if point and point not in points:
+        seen = set()
+        for point in islice(self.parse(content).iter_key_points(), max_points):
+            if point and point not in seen:
+                seen.add(point)
                 points.append(point)
         return points
     
@@ -404,13 +751,14 @@ Website: 57seconds.com
         
         return reddit_title.strip()
     
-    def _create_bullet_summary(self, content: str, num_bullets: int = 3) -> str:
+    def _create_bullet_summary(self, content: Union[str, ParsedDocument], num_bullets: int = 3) -> str:
         """Create bullet point summary"""
         key_points = self._extract_all_key_points(content, max_points=num_bullets)
         return '\n'.join([f"• {point}" for point in key_points])
     
-    def _create_video_script_outline(self, content: Dict) -> str:
+    def _create_video_script_outline(self, content: Dict, document: Optional[ParsedDocument] = None) -> str:
         """Create basic video script outline"""
+        document = document or self.parse(content)
         return f"""
 VIDEO SCRIPT OUTLINE
 
@@ -419,7 +767,7 @@ Introduction (0:00-0:30)
 - Why this matters
 - What we'll cover
 
-{self._create_bullet_summary(content['content_long'], num_bullets=5)}
+{self._create_bullet_summary(document, num_bullets=5)}
 
 Conclusion (6:00-7:00)
 - Recap key points
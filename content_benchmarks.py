@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+Content Storage Benchmarks
+Measures ContentManager storage paths on synthetic corpora
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import re
+import shutil
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from adaptation_cache import AdaptationCache
+from async_content_manager import AsyncContentManager
+from content_adapter import PLATFORMS as ADAPT_PLATFORMS, ContentAdapter
+from content_formats import available_codecs, available_serializers
+from content_importer import TOPIC_CATEGORIES, ContentImporter
+from content_manager import ContentManager, RevisionConflictError
+from sqlite_content_manager import SQLiteContentManager, migrate_json_to_sqlite
+from text_processing import meta_description, summarize
+
+
+CATEGORIES = ["Software Development", "Digital Marketing", "Business Automation", "Case Studies"]
+TAGS = ["custom software", "business", "ROI", "automation", "zapier", "seo", "workflow"]
+
+PARAGRAPH = (
+    "Your team is drowning in spreadsheets. Sales data lives in one system and customer "
+    "info in another. Custom business software might be the answer, but it's a significant "
+    "investment and you need to know if it's right for your business. "
+)
+
+
+def make_record(index: int, body_words: int = 400) -> Dict:
+    """Build a synthetic content record shaped like ContentManager output"""
+    modified = datetime(2025, 1, 1) + timedelta(minutes=index)
+    repeats = max(1, body_words // len(PARAGRAPH.split()))
+    return {
+        "content_id": str(uuid.uuid4()),
+        "title": f"Synthetic Article {index}",
+        "slug": f"synthetic-article-{index}",
+        "content_long": "\n\n".join([PARAGRAPH] * repeats),
+        "content_summary": PARAGRAPH[:200],
+        "meta_description": PARAGRAPH[:155],
+        "keywords": ["custom business software"],
+        "tags": random.sample(TAGS, 3),
+        "category": CATEGORIES[index % len(CATEGORIES)],
+        "author": "Gera Yeremin",
+        "created_date": modified.isoformat(),
+        "modified_date": modified.isoformat(),
+        "published_date": None,
+        "status": "draft" if index % 3 else "published",
+        "canonical_url": None,
+        "syndication_status": {},
+        "analytics": {"total_views": index % 100, "total_engagements": 0, "platform_performance": {}}
+    }
+
+
+def seed_json_tree(base_dir: Path, count: int, body_words: int = 400) -> List[str]:
+    """Write a JSON content tree directly, as an existing corpus would look on disk"""
+    ids = []
+    for directory in ["drafts", "published"]:
+        (base_dir / directory).mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        record = make_record(i, body_words)
+        directory = "drafts" if record["status"] == "draft" else "published"
+        with open(base_dir / directory / f"{record['content_id']}.json", 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2, ensure_ascii=False)
+        ids.append(record["content_id"])
+    return ids
+
+
+def timed(fn: Callable, repeat: int = 1) -> float:
+    """Best wall-clock time of fn over repeat runs, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def print_table(title: str, rows: List[tuple]):
+    """Print benchmark rows as an aligned table"""
+    print("\n" + "=" * 60)
+    print(title)
+    print("=" * 60)
+    for name, value in rows:
+        print(f"{name:<44}{value:>14}")
+
+
+def bench_backends(sizes: List[int]):
+    """Compare the JSON-file and SQLite backends at each corpus size"""
+    for size in sizes:
+        workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+        try:
+            ids = seed_json_tree(workdir, size)
+            sample = random.sample(ids, min(200, len(ids)))
+
+            json_manager = ContentManager(str(workdir))
+            json_rows = [
+                ("list_metadata (cold, builds index)", timed(json_manager.list_metadata)),
+                ("list_metadata (warm)", timed(json_manager.list_metadata, 3)),
+                ("list_content('published')", timed(lambda: json_manager.list_content("published"))),
+                ("category filter via list_metadata", timed(
+                    lambda: [e for e in json_manager.list_metadata() if e["category"] == CATEGORIES[0]], 3)),
+                ("get_stats", timed(json_manager.get_stats, 3)),
+                (f"get_content x{len(sample)}", timed(lambda: [json_manager.get_content(i) for i in sample], 3)),
+            ]
+
+            migrate_ms = timed(lambda: migrate_json_to_sqlite(str(workdir)))
+            sqlite_manager = SQLiteContentManager(str(workdir))
+            sqlite_rows = [
+                ("migrate JSON tree", migrate_ms),
+                ("list_metadata", timed(sqlite_manager.list_metadata, 3)),
+                ("list_content('published')", timed(lambda: sqlite_manager.list_content("published"))),
+                ("list_by_category", timed(lambda: sqlite_manager.list_by_category(CATEGORIES[0]), 3)),
+                ("get_stats", timed(sqlite_manager.get_stats, 3)),
+                (f"get_content x{len(sample)}", timed(lambda: [sqlite_manager.get_content(i) for i in sample], 3)),
+            ]
+            sqlite_manager.close()
+
+            print_table(f"JSON backend, {size} items (ms)", [(n, f"{v:.1f}") for n, v in json_rows])
+            print_table(f"SQLite backend, {size} items (ms)", [(n, f"{v:.1f}") for n, v in sqlite_rows])
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def bench_batch_writes(count: int):
+    """Compare per-save durable record writes with the same saves inside batch()"""
+    workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+    try:
+        seed_json_tree(workdir, count)
+        manager = ContentManager(str(workdir))
+        ids = [entry["content_id"] for entry in manager.list_metadata()]
+
+        def update_all(category: str):
+            for content_id in ids:
+                manager.update_content(content_id, {"category": category})
+
+        def create_all(prefix: str):
+            for i in range(count):
+                manager.create_content(f"{prefix} {i}", PARAGRAPH, ["benchmark"], "Benchmarks")
+
+        def batched(fn: Callable, arg: str):
+            with manager.batch():
+                fn(arg)
+
+        rows = [
+            ("update_content, one save at a time", timed(lambda: update_all("Durable"))),
+            ("update_content, inside batch()", timed(lambda: batched(update_all, "Batched"))),
+            ("create_content, one save at a time", timed(lambda: create_all("Durable"))),
+            ("create_content, inside batch()", timed(lambda: batched(create_all, "Batched"))),
+        ]
+        manager.fsync = False
+        rows.append(("update_content, no fsync, inside batch()", timed(lambda: batched(update_all, "Unsynced"))))
+        rows.append(("create_content, no fsync, inside batch()", timed(lambda: batched(create_all, "Unsynced"))))
+
+        print_table(f"Record and index saves, {count} items (ms)", [(n, f"{v:.1f}") for n, v in rows])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+PLATFORMS = ["medium", "devto", "linkedin", "reddit", "quora", "substack"]
+
+
+def bench_syndication(count: int):
+    """Compare per-call syndication updates with bulk_update_syndication_status"""
+    workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+    try:
+        seed_json_tree(workdir, count)
+        manager = ContentManager(str(workdir))
+        ids = [entry["content_id"] for entry in manager.list_metadata()]
+        updates = [(content_id, platform, "published", f"https://{platform}.example/{content_id}")
+                   for content_id in ids for platform in PLATFORMS]
+
+        def per_call():
+            for content_id, platform, status, url in updates:
+                manager.update_syndication_status(content_id, platform, status, url)
+
+        rows = [
+            ("update_syndication_status loop", timed(per_call)),
+            ("bulk_update_syndication_status", timed(lambda: manager.bulk_update_syndication_status(updates))),
+        ]
+
+        print_table(f"Syndication fan-out, {count} items x {len(PLATFORMS)} platforms",
+                    [(n, f"{v:.1f} ms ({len(updates) / (v / 1000):.0f}/s)") for n, v in rows])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def directory_bytes(directory: Path) -> int:
+    """Total size of files under a directory"""
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
+
+
+def bench_formats(count: int):
+    """Compare write/read throughput and bytes on disk for each storage format"""
+    records = [make_record(i, body_words=3000) for i in range(count)]
+    rows = []
+    for serializer in available_serializers():
+        for codec in available_codecs():
+            workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+            try:
+                manager = ContentManager(str(workdir), fsync=False, serializer=serializer, body_codec=codec)
+
+                def write_all():
+                    with manager.batch():
+                        for record in records:
+                            manager._save_content(record, is_draft=record["status"] == "draft")
+
+                def read_all():
+                    manager.clear_cache()
+                    manager.list_content()
+
+                write_ms = timed(write_all)
+                read_ms = timed(read_all, 3)
+                size = directory_bytes(workdir / "drafts") + directory_bytes(workdir / "published")
+                rows.append((f"{serializer} + {codec}",
+                             f"w {count / write_ms * 1000:.0f}/s  r {count / read_ms * 1000:.0f}/s  "
+                             f"{size / count / 1024:.1f} KB/item"))
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+    print_table(f"Storage formats, {count} items of ~3,000 words", rows)
+
+
+def _stress_worker(base_dir: str, ids: List[str], rounds: int, worker: int) -> tuple:
+    """Increment total_views on shared records with optimistic concurrency"""
+    manager = ContentManager(base_dir)
+    conflicts = 0
+    for i in range(rounds):
+        content_id = ids[i % len(ids)]
+        while True:
+            content = manager.get_content(content_id, include_body=False)
+            analytics = dict(content["analytics"], total_views=content["analytics"]["total_views"] + 1)
+            try:
+                manager.update_content(content_id, {"analytics": analytics},
+                                       expected_revision=content["revision"])
+                break
+            except RevisionConflictError:
+                conflicts += 1
+        manager.update_syndication_status(content_id, f"platform-{worker}", "published")
+    return rounds, conflicts
+
+
+def bench_stress(processes: int, count: int, records: int = 4):
+    """Hammer a few records from many processes and check no update was lost"""
+    workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+    try:
+        manager = ContentManager(str(workdir))
+        ids = [manager.create_content(f"Shared Article {i}", PARAGRAPH, ["stress"], CATEGORIES[0])["content_id"]
+               for i in range(records)]
+
+        start = time.perf_counter()
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.starmap(_stress_worker, [(str(workdir), ids, count, w) for w in range(processes)])
+        elapsed = time.perf_counter() - start
+
+        updates = sum(r[0] for r in results)
+        conflicts = sum(r[1] for r in results)
+        views = sum(manager.get_content(i)["analytics"]["total_views"] for i in ids)
+        platforms = min(len(manager.get_content(i)["syndication_status"]) for i in ids)
+
+        print_table(f"Stress: {processes} processes x {count} updates on {records} records", [
+            ("updates applied", f"{views}/{updates}"),
+            ("revision conflicts retried", str(conflicts)),
+            ("syndication platforms per record", f"{platforms}/{processes}"),
+            ("throughput", f"{updates / elapsed:.0f}/s"),
+        ])
+        if views != updates:
+            raise SystemExit("Lost updates detected")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def bench_async(count: int):
+    """Compare sync loads with AsyncContentManager.aget_many at several pool sizes"""
+    workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+    try:
+        ids = seed_json_tree(workdir, count, body_words=3000)
+        manager = ContentManager(str(workdir), cache_size=0)
+        manager.list_metadata()
+
+        rows = [
+            ("sync list_content", timed(manager.list_content, 3)),
+            (f"sync get_content x{count}", timed(lambda: [manager.get_content(i) for i in ids], 3)),
+        ]
+
+        for workers in [4, 8, 16]:
+            async_manager = AsyncContentManager(max_workers=workers, manager=manager)
+
+            async def list_all():
+                return await async_manager.alist_content()
+
+            async def load_all():
+                return await async_manager.aget_many(ids)
+
+            rows.append((f"alist_content ({workers} threads)", timed(lambda: asyncio.run(list_all()), 3)))
+            rows.append((f"aget_many x{count} ({workers} threads)", timed(lambda: asyncio.run(load_all()), 3)))
+            async_manager.close()
+
+        print_table(f"Sync vs async loading, {count} items (ms)", [(n, f"{v:.1f}") for n, v in rows])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def bench_parallel(count: int, processes: int):
+    """Cold-start list_content: sequential vs thread and process pools"""
+    workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+    try:
+        seed_json_tree(workdir, count)
+
+        def cold_list(**kwargs):
+            # No index and no cache, as on the first run against an existing tree
+            (workdir / "index.json").unlink(missing_ok=True)
+            (workdir / "index.journal.jsonl").unlink(missing_ok=True)
+            return ContentManager(str(workdir), cache_size=0).list_content(include_body=False, **kwargs)
+
+        rows = [("sequential", timed(cold_list))]
+        for workers in sorted({2, 4, max(processes, 2)}):
+            rows.append((f"{workers} threads", timed(lambda: cold_list(workers=workers))))
+            rows.append((f"{workers} processes", timed(lambda: cold_list(workers=workers, use_processes=True))))
+
+        print_table(f"Cold list_content, {count} items (ms)", [(n, f"{v:.1f}") for n, v in rows])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def bench_revisions(edits: int):
+    """Revision history storage for a 3,000-word article edited many times"""
+    rng = random.Random(7)
+    words = PARAGRAPH.split()
+
+    def paragraph() -> str:
+        return " ".join(rng.choice(words) for _ in range(60)) + "."
+
+    paragraphs = [paragraph() for _ in range(50)]
+    versions = ["\n\n".join(paragraphs)]
+    for _ in range(edits):
+        paragraphs[rng.randrange(len(paragraphs))] = paragraph()
+        versions.append("\n\n".join(paragraphs))
+
+    full_copies = sum(len(body.encode("utf-8")) for body in versions)
+    rows = [("full copy per revision", f"{full_copies:,}")]
+
+    for label, options in [
+        ("delta log", {}),
+        ("delta log + blob store (paragraph)", {"blob_store": True}),
+        ("delta log + blob store (rolling)", {"blob_store": True, "blob_chunker": "rolling"}),
+    ]:
+        workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+        try:
+            manager = ContentManager(str(workdir), fsync=False, **options)
+            content_id = manager.create_content("Revisions", versions[0], ["revisions"], CATEGORIES[0])["content_id"]
+            for body in versions[1:]:
+                manager.update_content(content_id, {"content_long": body})
+            manager.collect_blob_garbage()
+
+            stored = sum(directory_bytes(workdir / name) for name in ["drafts", "revisions", "blobs"]
+                         if (workdir / name).exists())
+            read_ms = timed(lambda: [manager.get_revision(content_id, n) for n in range(1, edits + 2, 10)])
+            rows.append((label, f"{stored:,}"))
+            rows.append((f"  get_revision x{len(range(1, edits + 2, 10))} (ms)", f"{read_ms:.1f}"))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_table(f"Revision history, {len(versions[0].split())} words, {edits} edits (bytes)", rows)
+
+
+def bench_text(count: int):
+    """Summary and meta description generation on 100KB bodies"""
+    body = "\n\n".join([PARAGRAPH] * (100 * 1024 // len(PARAGRAPH)))
+
+    def full_split():
+        # What _generate_summary did before: clean and split the whole body
+        cleaned = re.sub(r'[#*`\[\]()<>]', '', body)
+        return re.split(r'[.!?]+', cleaned)
+
+    rows = [
+        (f"full clean + split x{count}", timed(lambda: [full_split() for _ in range(count)])),
+        (f"summarize x{count}", timed(lambda: [summarize(body) for _ in range(count)])),
+        (f"meta_description x{count}", timed(lambda: [meta_description(body) for _ in range(count)])),
+    ]
+
+    workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+    try:
+        manager = ContentManager(str(workdir), fsync=False)
+        creates = max(1, count // 10)
+        rows.append((f"create_content x{creates}", timed(
+            lambda: [manager.create_content(f"Text {i}", body, ["text"], CATEGORIES[0]) for i in range(creates)]
+        )))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_table(f"Text processing, {len(body) // 1024}KB body (ms)", [(n, f"{v:.1f}") for n, v in rows])
+
+
+def bench_import(count: int):
+    """Bulk MDX import: first run, re-run over an unchanged tree, and without the manifest"""
+    workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+    try:
+        posts_dir = workdir / "posts"
+        posts_dir.mkdir()
+        body = "\n\n".join([PARAGRAPH] * 20)
+        for i in range(count):
+            (posts_dir / f"post-{i}.mdx").write_text(
+                f'---\ntitle: "Post {i}"\ndescription: "Synthetic post {i}"\npublishDate: 2025-01-01\n'
+                f'topic: "{list(TOPIC_CATEGORIES)[i % len(TOPIC_CATEGORIES)]}"\ntags: ["bench"]\n'
+                f'draft: {"true" if i % 3 else "false"}\n---\n\n# Post {i}\n\n{body}\n',
+                encoding="utf-8"
+            )
+
+        importer = ContentImporter(ContentManager(str(workdir / "content"), fsync=False), workers=4)
+        rows = [
+            ("first import", timed(lambda: importer.import_paths([str(posts_dir)]))),
+            ("re-import, unchanged", timed(lambda: importer.import_paths([str(posts_dir)]))),
+        ]
+        importer.manifest_path.unlink()
+        rows.append(("re-import, no manifest", timed(lambda: importer.import_paths([str(posts_dir)]))))
+
+        print_table(f"MDX import, {count} files (ms)", [(n, f"{v:.1f}") for n, v in rows])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def make_article(words: int) -> str:
+    """Markdown article of about words words: ## sections of a few paragraphs each"""
+    paragraph_words = len(PARAGRAPH.split())
+    sections = []
+    for section in range(max(1, words // (paragraph_words * 4))):
+        sections.append(f"## {section + 1}. Section {section + 1}\n\n" + "\n\n".join([PARAGRAPH] * 4))
+    return "# Benchmark Article\n\n" + "\n\n".join(sections) + "\n"
+
+
+def bench_adapt(count: int, processes: int):
+    """Fan articles out to every platform: parsing per method vs once, and adapt_many on a process pool"""
+    content = make_record(0)
+    content["content_long"] = make_article(10000)
+    content["canonical_url"] = "https://example.com/benchmark-article"
+    runs = max(1, count // 100)
+
+    # A cache of zero makes every adapt_for_* method parse the body itself
+    per_method = ContentAdapter(document_cache_size=0)
+    shared = ContentAdapter()
+
+    rows = [
+        (f"parse per method x{runs}", timed(lambda: [per_method.adapt_all(content) for _ in range(runs)])),
+        (f"adapt_all, parse once x{runs}", timed(lambda: [shared.adapt_all(content) for _ in range(runs)])),
+    ]
+
+    workdir = Path(tempfile.mkdtemp(prefix="content_bench_"))
+    try:
+        cached = ContentAdapter(cache=AdaptationCache(workdir / "adaptations"))
+        cached.adapt_all(content)
+        rows.append((f"adapt_all, cached x{runs}", timed(lambda: [cached.adapt_all(content) for _ in range(runs)])))
+        disk = ContentAdapter(cache=AdaptationCache(workdir / "adaptations", max_entries=0))
+        rows.append((f"adapt_all, disk tier only x{runs}", timed(lambda: [disk.adapt_all(content) for _ in range(runs)])))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print_table(f"Adapt to {len(ADAPT_PLATFORMS)} platforms, {len(content['content_long'].split())} words (ms)",
+                [(n, f"{v:.1f}") for n, v in rows])
+
+    corpus = [make_record(i, body_words=2000) for i in range(count)]
+    rows = [("adapt_many, 1 worker", timed(lambda: ContentAdapter().adapt_many(corpus)))]
+    for workers in sorted({2, max(2, processes)}):
+        rows.append((f"adapt_many, {workers} processes", timed(
+            lambda: ContentAdapter().adapt_many(corpus, workers=workers)
+        )))
+    print_table(f"Adapt {count} 2,000-word articles to {len(ADAPT_PLATFORMS)} platforms (ms)",
+                [(n, f"{v:.1f}") for n, v in rows])
+
+
+def bench_key_points(count: int):
+    """_extract_all_key_points(max_points=8) on 10,000-word articles vs the rescanning version"""
+
+    def rescanning_key_points(content: str, max_points: int = 8) -> List[str]:
+        # What _extract_all_key_points did before: rescan every line, then
+        # re-split every sentence, once per point
+        def key_point(point_number: int) -> str:
+            points_found = 0
+            for line in content.split('\n'):
+                if re.match(r'^\d+\.|\*\*\d+\.|##', line.strip()):
+                    points_found += 1
+                    if points_found == point_number:
+                        return re.sub(r'[#*\d\.]', '', line).strip()[:100]
+            sentences = [s.strip() for s in re.split(r'[.!?]', content) if len(s.strip()) > 30]
+            if point_number <= len(sentences):
+                return sentences[point_number - 1][:100]
+            return "Key insight from the article"
+
+        points = []
+        for i in range(1, max_points + 1):
+            point = key_point(i)
+            if point and point not in points:
+                points.append(point)
+        return points
+
+    articles = {
+        "sectioned": make_article(10000),
+        "plain prose": "\n\n".join([PARAGRAPH] * (10000 // len(PARAGRAPH.split()))),
+    }
+    runs = max(1, count // 10)
+    rows = []
+    for shape, article in articles.items():
+        warm = ContentAdapter()
+        warm.parse(article)
+        rows += [
+            (f"{shape}: rescanning x{runs}", timed(lambda: [rescanning_key_points(article) for _ in range(runs)])),
+            (f"{shape}: single pass, cold x{runs}", timed(
+                lambda: [ContentAdapter()._extract_all_key_points(article) for _ in range(runs)]
+            )),
+            (f"{shape}: single pass, parsed x{runs}", timed(
+                lambda: [warm._extract_all_key_points(article) for _ in range(runs)]
+            )),
+        ]
+    print_table("Key points, max_points=8 (ms)", [(n, f"{v:.1f}") for n, v in rows])
+
+
+def bench_shorten(count: int):
+    """_shorten_content on a 10,000-word article at each platform's target vs split-and-join"""
+    article = make_article(10000)
+    adapter = ContentAdapter()
+
+    def split_and_join(target_words: int) -> str:
+        # What _shorten_content did before: split the whole body, join the first N words
+        words = article.split()
+        shortened = ' '.join(words[:target_words])
+        last_period = shortened.rfind('.')
+        return shortened[:last_period + 1] if last_period > len(shortened) * 0.8 else shortened + "..."
+
+    rows = []
+    for target in [800, 1000, 1500, 2000]:
+        rows += [
+            (f"{target} words: split and join x{count}", timed(lambda: [split_and_join(target) for _ in range(count)])),
+            (f"{target} words: streaming x{count}", timed(
+                lambda: [adapter._shorten_content(article, target) for _ in range(count)]
+            )),
+        ]
+    print_table("Shorten a 10,000-word article (ms)", [(n, f"{v:.1f}") for n, v in rows])
+
+
+BENCHMARKS = {
+    "adapt": lambda args: bench_adapt(args.count, args.processes),
+    "key-points": lambda args: bench_key_points(args.count),
+    "backends": lambda args: bench_backends(args.sizes),
+    "batch-writes": lambda args: bench_batch_writes(args.count),
+    "syndication": lambda args: bench_syndication(args.count),
+    "formats": lambda args: bench_formats(args.count),
+    "stress": lambda args: bench_stress(args.processes, args.count),
+    "async": lambda args: bench_async(args.count),
+    "parallel": lambda args: bench_parallel(args.count, args.processes),
+    "revisions": lambda args: bench_revisions(args.edits),
+    "shorten": lambda args: bench_shorten(args.count),
+    "text": lambda args: bench_text(args.count),
+    "import": lambda args: bench_import(args.count),
+}
+
+
+def main():
+    """Run the selected benchmarks"""
+    parser = argparse.ArgumentParser(description="Content storage benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS) + ["all"], help="Benchmark to run")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000],
+                        help="Corpus sizes to test")
+    parser.add_argument("--count", type=int, default=1000,
+                        help="Items touched by write benchmarks")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(),
+                        help="Worker processes for the stress, parallel and adapt benchmarks")
+    parser.add_argument("--edits", type=int, default=200,
+                        help="Edits per article for the revisions benchmark")
+    args = parser.parse_args()
+
+    selected = sorted(BENCHMARKS) if args.benchmark == "all" else [args.benchmark]
+    for name in selected:
+        BENCHMARKS[name](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Content-Addressed Blob Store
+Stores text as deduplicated chunks named by their SHA-256 digest, so bodies and
+revisions that share most of their text share most of their storage
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+CHUNKERS = ["paragraph", "rolling"]
+
+# Paragraphs longer than this are split further with the rolling chunker
+MAX_PARAGRAPH_CHUNK = 16 * 1024
+
+# Rolling chunker: boundaries where the top bits of the gear hash are zero,
+# giving chunks of about 1.3KB, never smaller than 256 bytes or larger than 8KB
+ROLLING_BITS = 10
+ROLLING_MIN = 256
+ROLLING_MAX = 8 * 1024
+
+# Fixed pseudo-random byte table, so boundaries are stable across runs
+_GEAR_RANDOM = random.Random(0x5EED)
+_GEAR = [_GEAR_RANDOM.getrandbits(32) for _ in range(256)]
+
+_PARAGRAPH_BREAK = re.compile(rb"\n[ \t]*\n\s*")
+
+
+def chunk_rolling(data: bytes) -> List[bytes]:
+    """
+    Split bytes at content-defined boundaries
+
+    An edit only changes the chunks around it: boundaries depend on the
+    bytes just before them, not on their offset, so inserting text does
+    not shift every later chunk.
+    """
+    chunks = []
+    start = 0
+    h = 0
+    for i, byte in enumerate(data):
+        h = ((h << 1) + _GEAR[byte]) & 0xFFFFFFFF
+        size = i + 1 - start
+        if (size >= ROLLING_MIN and not h >> (32 - ROLLING_BITS)) or size >= ROLLING_MAX:
+            chunks.append(data[start:i + 1])
+            start = i + 1
+            h = 0
+    if start < len(data):
+        chunks.append(data[start:])
+    return chunks
+
+
+def chunk_paragraphs(data: bytes) -> List[bytes]:
+    """
+    Split bytes after each paragraph break, keeping the break with its paragraph
+
+    Very long paragraphs are split further with chunk_rolling().
+    """
+    chunks = []
+    start = 0
+    for match in _PARAGRAPH_BREAK.finditer(data):
+        chunks.append(data[start:match.end()])
+        start = match.end()
+    if start < len(data):
+        chunks.append(data[start:])
+
+    split = []
+    for chunk in chunks:
+        if len(chunk) > MAX_PARAGRAPH_CHUNK:
+            split.extend(chunk_rolling(chunk))
+        else:
+            split.append(chunk)
+    return split
+
+
+def diff_chunks(old: List[List], new: List[List]) -> List[List]:
+    """
+    Encode a chunk list as edits against another
+
+    Returns:
+        Ops list: [start, end] copies old[start:end], [digest, size] is a
+        new chunk
+    """
+    ops = []
+    matcher = difflib.SequenceMatcher(None, [c[0] for c in old], [c[0] for c in new], autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        else:
+            ops.extend([digest, size] for digest, size in new[j1:j2])
+    return ops
+
+
+def patch_chunks(old: List[List], ops: List[List]) -> List[List]:
+    """Rebuild a chunk list from the one it was diffed against and diff_chunks ops"""
+    chunks = []
+    for first, second in ops:
+        if isinstance(first, str):
+            chunks.append([first, second])
+        else:
+            chunks.extend(old[first:second])
+    return chunks
+
+
+class BlobStore:
+    """
+    Content-addressed store for text blobs
+
+    put() splits text into chunks, writes each chunk once under its digest
+    and returns the digest of a small manifest listing the chunks. That
+    digest is the reference callers keep; get() reassembles the text.
+    Blobs are immutable, so writes never conflict and reads need no locks.
+    """
+
+    def __init__(self, root: Path, chunker: str = "paragraph", fsync: bool = True):
+        if chunker not in CHUNKERS:
+            raise ValueError(f"Unknown chunker '{chunker}', expected one of {CHUNKERS}")
+        self.root = Path(root)
+        self.chunker = chunker
+        self.fsync = fsync
+
+    def put(self, text: str) -> str:
+        """
+        Store text
+
+        Args:
+            text: Text to store
+
+        Returns:
+            Reference (manifest digest) for get()
+        """
+        data = text.encode("utf-8")
+        pieces = chunk_rolling(data) if self.chunker == "rolling" else chunk_paragraphs(data)
+        return self.put_manifest([[self._write(piece), len(piece)] for piece in pieces])
+
+    def put_manifest(self, chunks: List[List]) -> str:
+        """Store a manifest for chunks that are already stored, returning its reference"""
+        manifest = json.dumps({"chunks": chunks}, separators=(",", ":"))
+        return self._write(manifest.encode("utf-8"))
+
+    def get(self, ref: str) -> str:
+        """
+        Read text stored by put()
+
+        Raises:
+            ValueError: If the reference or one of its chunks is missing
+        """
+        return self.assemble(self.chunks(ref))
+
+    def chunks(self, ref: str) -> List[List]:
+        """The [digest, size] chunk list of a reference"""
+        return json.loads(self._read(ref))["chunks"]
+
+    def assemble(self, chunks: List[List]) -> str:
+        """
+        Join chunks back into text
+
+        Chunks are read straight into one preallocated buffer, which is
+        decoded once.
+
+        Raises:
+            ValueError: If a chunk is missing
+        """
+        buffer = bytearray(sum(size for _, size in chunks))
+        view = memoryview(buffer)
+        offset = 0
+        for digest, size in chunks:
+            try:
+                with open(self._path(digest), 'rb') as f:
+                    f.readinto(view[offset:offset + size])
+            except FileNotFoundError:
+                raise ValueError(f"Blob chunk {digest} not found")
+            offset += size
+        return buffer.decode("utf-8")
+
+    def exists(self, ref: str) -> bool:
+        """Whether a blob is stored"""
+        return self._path(ref).exists()
+
+    def references(self, ref: str) -> List[str]:
+        """Digests a reference keeps alive: the manifest and its chunks"""
+        return [ref] + [digest for digest, _ in self.chunks(ref)]
+
+    def collect_garbage(self, live_refs: Iterable[str], live_chunks: Optional[Iterable[str]] = None) -> int:
+        """
+        Delete blobs not reachable from any live reference
+
+        Run it while nothing is writing: a put() in progress has written
+        chunks that no live reference points to yet.
+
+        Args:
+            live_refs: Every reference still in use
+            live_chunks: Chunk digests still in use outside any manifest
+
+        Returns:
+            Number of blobs deleted
+        """
+        live = set(live_chunks or ())
+        for ref in live_refs:
+            try:
+                live.update(self.references(ref))
+            except ValueError:
+                continue
+
+        deleted = 0
+        if not self.root.exists():
+            return deleted
+        for path in self.root.glob("*/*"):
+            if path.name not in live and not path.name.startswith("."):
+                path.unlink()
+                deleted += 1
+        return deleted
+
+    def disk_usage(self) -> int:
+        """Total bytes of stored blobs"""
+        if not self.root.exists():
+            return 0
+        return sum(path.stat().st_size for path in self.root.glob("*/*"))
+
+    def _path(self, digest: str) -> Path:
+        """Blobs are fanned out over 256 subdirectories by digest prefix"""
+        return self.root / digest[:2] / digest
+
+    def _read(self, digest: str) -> bytes:
+        """Read one whole blob"""
+        try:
+            with open(self._path(digest), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise ValueError(f"Blob {digest} not found")
+
+    def _write(self, data: bytes) -> str:
+        """Store bytes under their digest unless already present"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        return digest
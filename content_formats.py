@@ -0,0 +1,128 @@
+"""
+Content Storage Formats
+Serializers for content records and codecs for content bodies, with optional fast backends
+"""
+
+import gzip
+import json
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Written into every record as "_format" so readers know how the body is encoded.
+# Version 1 is the original layout (pretty JSON, plain UTF-8 body) and has no marker.
+FORMAT_VERSION = 2
+
+SERIALIZERS = ["pretty", "compact", "orjson", "msgspec"]
+BODY_CODECS = ["plain", "gzip", "zstd"]
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def available_serializers() -> List[str]:
+    """Serializers usable in this environment"""
+    available = ["pretty", "compact"]
+    if orjson is not None:
+        available.append("orjson")
+    if msgspec is not None:
+        available.append("msgspec")
+    return available
+
+
+def available_codecs() -> List[str]:
+    """Body codecs usable in this environment"""
+    available = ["plain", "gzip"]
+    if zstandard is not None:
+        available.append("zstd")
+    return available
+
+
+def check_format(serializer: str, codec: str):
+    """
+    Validate a serializer and body codec choice
+
+    Raises:
+        ValueError: If either is unknown or its package is not installed
+    """
+    if serializer not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer '{serializer}', expected one of {SERIALIZERS}")
+    if codec not in BODY_CODECS:
+        raise ValueError(f"Unknown body codec '{codec}', expected one of {BODY_CODECS}")
+    if serializer not in available_serializers():
+        raise ValueError(f"Serializer '{serializer}' requires the {serializer} package")
+    if codec not in available_codecs():
+        raise ValueError("Body codec 'zstd' requires the zstandard package")
+
+
+def dumps_record(record: Dict, serializer: str = "pretty") -> bytes:
+    """Serialize a record to UTF-8 JSON bytes"""
+    if serializer == "orjson":
+        return orjson.dumps(record)
+    if serializer == "msgspec":
+        return msgspec.json.encode(record)
+    if serializer == "compact":
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(record, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def loads_record(data: bytes) -> Dict:
+    """Parse JSON bytes written by any serializer, using the fastest parser available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def encode_body(text: str, codec: str = "plain") -> bytes:
+    """Encode a content body for storage"""
+    data = text.encode("utf-8")
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if codec == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def decode_body(data: bytes, codec: Optional[str] = None) -> str:
+    """
+    Decode a stored content body
+
+    Args:
+        data: Raw file bytes
+        codec: Codec from the record's format marker; sniffed from the
+            magic bytes when missing
+
+    Returns:
+        Body text
+    """
+    if codec is None:
+        if data[:2] == GZIP_MAGIC:
+            codec = "gzip"
+        elif data[:4] == ZSTD_MAGIC:
+            codec = "zstd"
+        else:
+            codec = "plain"
+
+    if codec == "gzip":
+        data = gzip.decompress(data)
+    elif codec == "zstd":
+        if zstandard is None:
+            raise ValueError("Body is zstd-compressed but the zstandard package is not installed")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return data.decode("utf-8")
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Image Asset Registry
+Stores content images once per distinct file, named by SHA-256 digest, with a
+manifest of dimensions, format and size for every asset
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import struct
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+MANIFEST_VERSION = 1
+
+# Image format -> file extension used for stored assets
+IMAGE_EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp", "gif": ".gif"}
+
+# File extensions recognised when scanning a directory
+SCAN_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# JPEG start-of-frame markers carry the image dimensions; C4, C8 and CC share
+# the range but are other segment types
+_JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def read_image_info(f: BinaryIO) -> Tuple[str, int, int]:
+    """
+    Read format and dimensions from an image file's header
+
+    Only the header is read (for JPEG, the segments up to the first frame
+    header), so this costs the same for a 10KB icon and a 5MB photo.
+
+    Args:
+        f: Binary file object positioned at the start of the image
+
+    Returns:
+        (format, width, height), format being one of IMAGE_EXTENSIONS
+
+    Raises:
+        ValueError: If the file is not a PNG, JPEG, WebP or GIF image
+    """
+    header = f.read(32)
+
+    if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", header[16:24])
+        return "png", width, height
+
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        width, height = struct.unpack("<HH", header[6:10])
+        return "gif", width, height
+
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        chunk = header[12:16]
+        if chunk == b"VP8 ":
+            width, height = struct.unpack("<HH", header[26:30])
+            return "webp", width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L":
+            bits = struct.unpack("<I", header[21:25])[0]
+            return "webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b"VP8X":
+            width = int.from_bytes(header[24:27], "little") + 1
+            height = int.from_bytes(header[27:30], "little") + 1
+            return "webp", width, height
+
+    if header[:2] == b"\xff\xd8":
+        return _read_jpeg_info(f)
+
+    raise ValueError("Unrecognised image format")
+
+
+def _read_jpeg_info(f: BinaryIO) -> Tuple[str, int, int]:
+    """Walk JPEG segments to the first start-of-frame header"""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        if not byte:
+            break
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":  # Fill bytes
+            marker = f.read(1)
+        if not marker:
+            break
+        code = marker[0]
+        if code == 0x01 or 0xD0 <= code <= 0xD9:  # Segments without a length
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            break
+        length = struct.unpack(">H", length_bytes)[0]
+        if code in _JPEG_SOF:
+            frame = f.read(5)
+            if len(frame) < 5:
+                break
+            height, width = struct.unpack(">HH", frame[1:5])
+            return "jpeg", width, height
+        f.seek(length - 2, os.SEEK_CUR)
+    raise ValueError("JPEG without a frame header")
+
+
+def hash_file(f: BinaryIO) -> Tuple[str, int]:
+    """SHA-256 hex digest and byte count of a file, read in blocks"""
+    digest = hashlib.sha256()
+    size = 0
+    for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+        digest.update(block)
+        size += len(block)
+    return digest.hexdigest(), size
+
+
+def probe_image(path: Path) -> Dict:
+    """
+    Hash an image file and read its header
+
+    Returns:
+        Dict with sha256, format, width, height and bytes
+
+    Raises:
+        ValueError: If the file is not a supported image
+    """
+    with open(path, 'rb') as f:
+        image_format, width, height = read_image_info(f)
+        f.seek(0)
+        sha256, size = hash_file(f)
+    return {"sha256": sha256, "format": image_format, "width": width, "height": height, "bytes": size}
+
+
+def find_duplicates(directory: str) -> Dict[str, List]:
+    """
+    Find identical files and format variants under a directory
+
+    Args:
+        directory: Directory to scan recursively
+
+    Returns:
+        Dict with "duplicates" (lists of paths with identical bytes),
+        "variants" (lists of paths sharing a name with different
+        extensions, e.g. png/webp pairs) and "reclaimable" (bytes
+        taken by the redundant copies of duplicates)
+    """
+    by_hash: Dict[str, List[str]] = {}
+    by_stem: Dict[str, List[str]] = {}
+    sizes: Dict[str, int] = {}
+
+    for path in sorted(Path(directory).rglob("*")):
+        if path.suffix.lower() not in SCAN_EXTENSIONS or not path.is_file():
+            continue
+        try:
+            info = probe_image(path)
+        except (OSError, ValueError):
+            continue
+        by_hash.setdefault(info["sha256"], []).append(str(path))
+        sizes[info["sha256"]] = info["bytes"]
+        by_stem.setdefault(str(path.with_suffix("")), []).append(str(path))
+
+    duplicates = [paths for paths in by_hash.values() if len(paths) > 1]
+    return {
+        "duplicates": duplicates,
+        "variants": [paths for paths in by_stem.values() if len(paths) > 1],
+        "reclaimable": sum(sizes[digest] * (len(paths) - 1) for digest, paths in by_hash.items()),
+    }
+
+
+class ImageRegistry:
+    """
+    Deduplicated image assets and the images attached to each content item
+
+    Every distinct file is stored once under images/assets, named by its
+    digest. A content item's images are hard links to those assets under
+    images/<content_id>/, so identical charts used by several articles
+    take the space of one. manifest.json holds the format, dimensions and
+    size of each asset and the images of each content item; it is kept in
+    memory, so lookups never walk the image directories.
+
+    Images with the same name in different formats (a png and its webp
+    conversion) are one image with several formats.
+    """
+
+    def __init__(self, root: Path, fsync: bool = True):
+        self.root = Path(root)
+        self.assets_dir = self.root / "assets"
+        self.manifest_path = self.root / "manifest.json"
+        self.fsync = fsync
+
+        self._assets: Optional[Dict[str, Dict]] = None
+        self._content: Optional[Dict[str, Dict[str, Dict]]] = None
+        self._refs: Dict[str, int] = {}
+        self._signature: Optional[tuple] = None
+        self._lock = threading.RLock()
+
+    def add(self, content_id: str, source: str, name: Optional[str] = None, alt: str = "") -> Dict:
+        """
+        Attach an image file to a content item
+
+        Args:
+            content_id: Content ID
+            source: Path of the image file
+            name: Image name (defaults to the file name without extension);
+                adding another format under an existing name adds a
+                variant of that image
+            alt: Alt text
+
+        Returns:
+            Image dict as returned by get()
+
+        Raises:
+            ValueError: If the file is not a supported image
+        """
+        source = Path(source)
+        info = probe_image(source)
+        name = name or source.stem
+        digest = info["sha256"]
+
+        with self._lock:
+            self._load()
+            asset = self._assets.get(digest)
+            if asset is None:
+                asset = self._store_asset(source, info)
+
+            images = self._content.setdefault(content_id, {})
+            image = images.setdefault(name, {"alt": alt, "added": datetime.now().isoformat(), "formats": {}})
+            if alt:
+                image["alt"] = alt
+
+            previous = image["formats"].get(info["format"])
+            if previous != digest:
+                image["formats"][info["format"]] = digest
+                self._refs[digest] = self._refs.get(digest, 0) + 1
+                self._link(content_id, name, asset)
+                if previous is not None:
+                    self._release(previous)
+
+            self._save()
+            return self._image_view(name, image)
+
+    def get(self, content_id: str) -> List[Dict]:
+        """
+        Images of a content item, in the order they were added
+
+        Returns:
+            List of dicts with name, alt, added and formats (format ->
+            asset dict with sha256, width, height, bytes and path)
+        """
+        with self._lock:
+            self._load()
+            images = self._content.get(content_id, {})
+            return [self._image_view(name, image) for name, image in images.items()]
+
+    def asset(self, digest: str) -> Optional[Dict]:
+        """Manifest entry of one asset, or None"""
+        with self._lock:
+            self._load()
+            asset = self._assets.get(digest)
+            return dict(asset, sha256=digest) if asset is not None else None
+
+    def remove(self, content_id: str, name: Optional[str] = None) -> int:
+        """
+        Detach images from a content item, deleting assets nothing else uses
+
+        Args:
+            content_id: Content ID
+            name: Image to remove; None removes all of the item's images
+
+        Returns:
+            Number of images removed
+        """
+        with self._lock:
+            self._load()
+            images = self._content.get(content_id)
+            if not images:
+                return 0
+            names = [name] if name is not None else list(images)
+            removed = 0
+            for image_name in names:
+                image = images.pop(image_name, None)
+                if image is None:
+                    continue
+                for image_format, digest in image["formats"].items():
+                    link = self.root / content_id / f"{image_name}{IMAGE_EXTENSIONS[image_format]}"
+                    if link.exists():
+                        link.unlink()
+                    self._release(digest)
+                removed += 1
+            if not images:
+                del self._content[content_id]
+            self._save()
+            return removed
+
+    def disk_usage(self) -> int:
+        """Bytes taken by stored assets"""
+        with self._lock:
+            self._load()
+            return sum(asset["bytes"] for asset in self._assets.values())
+
+    def _image_view(self, name: str, image: Dict) -> Dict:
+        """Image entry with its asset details filled in"""
+        formats = {
+            image_format: dict(self._assets[digest], sha256=digest)
+            for image_format, digest in image["formats"].items()
+        }
+        return {"name": name, "alt": image["alt"], "added": image["added"], "formats": formats}
+
+    def _store_asset(self, source: Path, info: Dict) -> Dict:
+        """Copy a new file into the asset store and record it"""
+        digest = info["sha256"]
+        relative = f"assets/{digest[:2]}/{digest}{IMAGE_EXTENSIONS[info['format']]}"
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            shutil.copyfile(source, tmp_path)
+            if self.fsync:
+                with open(tmp_path, 'rb') as f:
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+        asset = {key: info[key] for key in ("format", "width", "height", "bytes")}
+        asset["path"] = relative
+        self._assets[digest] = asset
+        return asset
+
+    def _link(self, content_id: str, name: str, asset: Dict):
+        """Expose an asset under the content item's images directory"""
+        link = self.root / content_id / f"{name}{IMAGE_EXTENSIONS[asset['format']]}"
+        link.parent.mkdir(parents=True, exist_ok=True)
+        if link.exists():
+            link.unlink()
+        try:
+            os.link(self.root / asset["path"], link)
+        except OSError:
+            # File systems without hard links get a copy
+            shutil.copyfile(self.root / asset["path"], link)
+
+    def _release(self, digest: str):
+        """Drop one reference to an asset, deleting it when none are left"""
+        count = self._refs.get(digest, 0) - 1
+        if count > 0:
+            self._refs[digest] = count
+            return
+        self._refs.pop(digest, None)
+        asset = self._assets.pop(digest, None)
+        if asset is not None:
+            path = self.root / asset["path"]
+            if path.exists():
+                path.unlink()
+
+    def _load(self):
+        """Load the manifest, again only if another process rewrote it"""
+        try:
+            stat = os.stat(self.manifest_path)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            signature = None
+        if self._assets is not None and signature == self._signature:
+            return
+
+        data = {}
+        if signature is not None:
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except ValueError:
+                data = {}
+        if data.get("version") != MANIFEST_VERSION:
+            data = {}
+
+        self._assets = data.get("assets", {})
+        self._content = data.get("content", {})
+        self._refs = {}
+        for images in self._content.values():
+            for image in images.values():
+                for digest in image["formats"].values():
+                    self._refs[digest] = self._refs.get(digest, 0) + 1
+        self._signature = signature
+
+    def _save(self):
+        """Write the manifest atomically"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(
+            {"version": MANIFEST_VERSION, "assets": self._assets, "content": self._content},
+            indent=2
+        ).encode("utf-8")
+        tmp_path = self.manifest_path.with_name(f".manifest.json.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.manifest_path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        stat = os.stat(self.manifest_path)
+        self._signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def main():
+    """Report duplicate images and format variants under a directory"""
+    parser = argparse.ArgumentParser(description="Find duplicate images")
+    parser.add_argument("directory", nargs="?", default="gera-yerem-in/public/images", help="Directory to scan")
+    args = parser.parse_args()
+
+    report = find_duplicates(args.directory)
+    for paths in report["duplicates"]:
+        print("Identical: " + ", ".join(paths))
+    for paths in report["variants"]:
+        print("Variants:  " + ", ".join(paths))
+    print(f"\n{len(report['duplicates'])} duplicate groups, "
+          f"{report['reclaimable'] / (1024 * 1024):.1f} MB reclaimable")
+
+
+if __name__ == "__main__":
+    main()
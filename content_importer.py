@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Bulk Markdown/MDX Import
+Loads articles with Astro-style frontmatter into ContentManager, skipping files
+that have not changed since the last import
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from content_manager import ContentManager
+from text_processing import slugify
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+SITE_URL = "https://gera.yerem.in"
+
+# Astro `topic` enum (src/content/config.ts) -> ContentManager category
+TOPIC_CATEGORIES = {
+    "software-development": "Software Development",
+    "digital-marketing": "Digital Marketing",
+    "business-automation": "Business Automation",
+}
+
+IMPORT_EXTENSIONS = (".md", ".mdx")
+
+MANIFEST_VERSION = 1
+
+_FRONTMATTER = re.compile(r'\A---[ \t]*\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|\Z)', re.DOTALL)
+_FIRST_HEADING = re.compile(r'^#[ \t]+(.+?)[ \t#]*$', re.MULTILINE)
+
+
+def parse_frontmatter(text: str) -> Tuple[Dict, str]:
+    """
+    Split a markdown document into its frontmatter and body
+
+    Uses PyYAML when installed; otherwise a parser for the subset Astro
+    posts use (scalars, quoted strings, inline and dash lists).
+
+    Args:
+        text: Document text
+
+    Returns:
+        (frontmatter dict, body); an empty dict if there is no frontmatter
+    """
+    match = _FRONTMATTER.match(text)
+    if not match:
+        return {}, text
+
+    body = text[match.end():]
+    if yaml is not None:
+        data = yaml.safe_load(match.group(1)) or {}
+    else:
+        data = _parse_simple_yaml(match.group(1))
+
+    if not isinstance(data, dict):
+        raise ValueError("Frontmatter must be a mapping")
+    return data, body
+
+
+def _parse_simple_yaml(block: str) -> Dict:
+    """Parse `key: value` lines, inline [a, b] lists and `- item` lists"""
+    data: Dict = {}
+    current_list: Optional[List] = None
+    for raw_line in block.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("- ") and current_list is not None:
+            current_list.append(_parse_scalar(line[2:].strip()))
+            continue
+
+        key, sep, value = line.partition(":")
+        if not sep:
+            raise ValueError(f"Invalid frontmatter line: {raw_line!r}")
+        key = key.strip()
+        value = value.strip()
+        if not value:
+            current_list = data[key] = []
+        else:
+            current_list = None
+            data[key] = _parse_scalar(value)
+    return data
+
+
+def _parse_scalar(value: str):
+    """Parse one frontmatter value"""
+    if value.startswith("[") and value.endswith("]"):
+        inner = value[1:-1].strip()
+        return [_parse_scalar(item.strip()) for item in inner.split(",")] if inner else []
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if lowered in ("null", "~"):
+        return None
+    if re.fullmatch(r'-?\d+', value):
+        return int(value)
+    return value
+
+
+def _iso(value) -> Optional[str]:
+    """Normalize a frontmatter date (YAML date, datetime or string) to ISO format"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).isoformat()
+    return datetime.fromisoformat(str(value)).isoformat()
+
+
+def parse_source(path: str) -> Dict:
+    """
+    Read, hash and parse one source file
+
+    Module-level so it can run in worker processes.
+
+    Returns:
+        Dict with path, hash, mtime_ns, size, frontmatter, body and title
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    frontmatter, body = parse_frontmatter(data.decode("utf-8"))
+
+    title = frontmatter.get("title")
+    if not title:
+        heading = _FIRST_HEADING.search(body)
+        title = heading.group(1).strip() if heading else Path(path).stem.replace("_", " ")
+
+    return {
+        "path": str(Path(path).resolve()),
+        "hash": hashlib.sha256(data).hexdigest(),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "frontmatter": frontmatter,
+        "body": body,
+        "title": title,
+    }
+
+
+def find_sources(paths: Iterable[str]) -> List[str]:
+    """Expand files and directories into the markdown/MDX files to import"""
+    found = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            found.extend(str(p) for p in sorted(path.rglob("*")) if p.suffix in IMPORT_EXTENSIONS)
+        elif path.suffix in IMPORT_EXTENSIONS:
+            found.append(str(path))
+        else:
+            raise ValueError(f"Not a markdown or MDX file: {path}")
+    return found
+
+
+class ContentImporter:
+    """
+    Imports markdown/MDX files into a ContentManager
+
+    Each file maps to one record, matched by slug (the file name, as Astro
+    uses it) and by the file's content hash, so re-running an import only
+    touches files that changed. A manifest of file stats lets unchanged
+    files be skipped without even reading them. Files are parsed on a
+    worker pool and written in batches.
+    """
+
+    def __init__(
+        self,
+        manager: ContentManager,
+        workers: int = 4,
+        batch_size: int = 50,
+        use_processes: bool = False,
+        default_category: str = "Uncategorized"
+    ):
+        self.manager = manager
+        self.workers = workers
+        self.batch_size = batch_size
+        self.use_processes = use_processes
+        self.default_category = default_category
+        self.manifest_path = manager.base_dir / "import_manifest.json"
+        # IDs of the records created or updated by the last import_paths()
+        self.imported: List[str] = []
+
+    def import_paths(self, paths: Iterable[str]) -> Dict[str, int]:
+        """
+        Import files and directories of .md/.mdx files
+
+        Args:
+            paths: Files, or directories searched recursively
+
+        Returns:
+            Counts of created, updated and unchanged files
+        """
+        manifest = self._load_manifest()
+        counts = {"created": 0, "updated": 0, "unchanged": 0}
+        self.imported = []
+
+        pending = []
+        for path in find_sources(paths):
+            key = str(Path(path).resolve())
+            if self._unchanged_on_disk(manifest.get(key), path):
+                counts["unchanged"] += 1
+            else:
+                pending.append(path)
+
+        if not pending:
+            return counts
+
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=self.workers) as executor:
+            parsed = executor.map(parse_source, pending, chunksize=max(1, len(pending) // (self.workers * 4)))
+
+            batch = []
+            for source in parsed:
+                batch.append(source)
+                if len(batch) >= self.batch_size:
+                    self._import_batch(batch, manifest, counts)
+                    batch = []
+            if batch:
+                self._import_batch(batch, manifest, counts)
+
+        return counts
+
+    def _import_batch(self, sources: List[Dict], manifest: Dict, counts: Dict[str, int]):
+        """Write one batch of parsed files, then persist the manifest"""
+        # Slugs are looked up and assigned under one slug lock per batch
+        with self.manager._slug_lock(), self.manager.batch():
+            for source in sources:
+                outcome, content_id = self._import_source(source, manifest)
+                counts[outcome] += 1
+                if outcome != "unchanged":
+                    self.imported.append(content_id)
+                manifest[source["path"]] = {
+                    "mtime_ns": source["mtime_ns"],
+                    "size": source["size"],
+                    "hash": source["hash"],
+                    "content_id": content_id,
+                }
+        self._save_manifest(manifest)
+
+    def _import_source(self, source: Dict, manifest: Dict) -> Tuple[str, str]:
+        """
+        Create or update the record for one parsed file
+
+        Returns:
+            (outcome, content_id) where outcome is "created", "updated" or "unchanged"
+        """
+        fields = self._record_fields(source)
+        existing = self._find_existing(source, fields, manifest.get(source["path"]))
+
+        if existing is not None and existing.get("source", {}).get("hash") == source["hash"]:
+            return "unchanged", existing["content_id"]
+
+        if existing is None:
+            content = self.manager._build_content(
+                fields["title"], fields["content_long"], fields["keywords"], fields["category"],
+                fields["meta_description"], fields["tags"], fields["author"]
+            )
+            outcome = "created"
+        else:
+            content = existing
+            content["content_summary"] = self.manager._generate_summary(fields["content_long"])
+            outcome = "updated"
+
+        if not fields["meta_description"]:
+            fields["meta_description"] = self.manager._generate_meta_description(fields["content_long"])
+        if not fields["modified_date"]:
+            fields["modified_date"] = datetime.now().isoformat()
+        content.update(fields)
+        content["created_date"] = fields["published_date"] or content["created_date"]
+        if content["status"] == "published":
+            content["canonical_url"] = f"{SITE_URL}/{content['slug']}/"
+
+        is_draft = content["status"] == "draft"
+        self.manager._save_content(content, is_draft=is_draft)
+        self.manager._discard_other_copy(content["content_id"], is_draft)
+        return outcome, content["content_id"]
+
+    def _find_existing(self, source: Dict, fields: Dict, previous: Optional[Dict]) -> Optional[Dict]:
+        """
+        Find the record a file was imported into before
+
+        Tries the manifest first, then the slug. A slug already taken by a
+        record imported from another file is not reused; the file gets the
+        next free "-2", "-3", ... slug instead, and fields["slug"] is
+        updated to match.
+        """
+        if previous:
+            existing = self.manager.get_content(previous["content_id"], include_body=False)
+            if existing is not None:
+                fields["slug"] = existing["slug"]
+                return existing
+
+        base_slug = fields["slug"]
+        suffix = 2
+        while True:
+            existing = self.manager.get_by_slug(fields["slug"], include_body=False)
+            if existing is None:
+                return None
+            owner = existing.get("source", {}).get("path")
+            if owner is None or owner == source["path"] or not os.path.exists(owner):
+                # Imported from this file, written by hand, or its file was renamed
+                return existing
+            fields["slug"] = f"{base_slug}-{suffix}"
+            suffix += 1
+
+    def _record_fields(self, source: Dict) -> Dict:
+        """Map frontmatter (src/content/config.ts schema) to ContentManager fields"""
+        frontmatter = source["frontmatter"]
+        tags = [str(tag) for tag in frontmatter.get("tags") or []]
+        slug = frontmatter.get("slug") or slugify(Path(source["path"]).stem)
+        published_date = _iso(frontmatter.get("publishDate"))
+        status = "draft" if frontmatter.get("draft") or not published_date else "published"
+
+        return {
+            "title": source["title"],
+            "slug": slug,
+            "content_long": source["body"],
+            "meta_description": frontmatter.get("description"),
+            "keywords": tags,
+            "tags": tags,
+            "category": TOPIC_CATEGORIES.get(frontmatter.get("topic"), self.default_category),
+            "author": frontmatter.get("author") or "Gera Yeremin",
+            "status": status,
+            "published_date": published_date,
+            "modified_date": _iso(frontmatter.get("updatedDate")) or published_date,
+            "canonical_url": None,
+            "featured": bool(frontmatter.get("featured", False)),
+            "source": {"path": source["path"], "hash": source["hash"]},
+        }
+
+    def mark_synced(self, path: str, content_id: str):
+        """
+        Record a file written from a record (e.g. an MDX export) as already imported
+
+        Args:
+            path: File that now matches the record
+            content_id: Record the file was written from
+        """
+        path = str(Path(path).resolve())
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+
+        manifest = self._load_manifest()
+        manifest[path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": digest, "content_id": content_id}
+        self._save_manifest(manifest)
+
+    def forget(self, paths: Iterable[str]):
+        """Drop files from the manifest, e.g. after they were deleted"""
+        manifest = self._load_manifest()
+        for path in paths:
+            manifest.pop(str(Path(path).resolve()), None)
+        self._save_manifest(manifest)
+
+    def _unchanged_on_disk(self, entry: Optional[Dict], path: str) -> bool:
+        """Whether a file still has the stat recorded by the last import"""
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        return (entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+                and self.manager._record_exists(entry["content_id"]))
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        """Load the import manifest, starting empty if missing or outdated"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _save_manifest(self, manifest: Dict[str, Dict]):
+        """Write the manifest atomically"""
+        data = json.dumps({"version": MANIFEST_VERSION, "files": manifest}, indent=2, ensure_ascii=False)
+        self.manager._atomic_write(self.manifest_path, data.encode("utf-8"))
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Import markdown/MDX articles into the content store")
+    parser.add_argument("paths", nargs="+", help="Files or directories of .md/.mdx files")
+    parser.add_argument("--base-dir", default="content_data", help="Content store directory")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel parsers")
+    parser.add_argument("--batch-size", type=int, default=50, help="Records written per batch")
+    parser.add_argument("--processes", action="store_true", help="Parse in processes instead of threads")
+    args = parser.parse_args()
+
+    importer = ContentImporter(
+        ContentManager(args.base_dir),
+        workers=args.workers,
+        batch_size=args.batch_size,
+        use_processes=args.processes
+    )
+    counts = importer.import_paths(args.paths)
+    print(f"Created {counts['created']}, updated {counts['updated']}, unchanged {counts['unchanged']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,27 +3,399 @@ Content Management System for Publishing & Syndication
 Handles content creation, storage, versioning, and metadata management
 """
 
+import copy
+import difflib
+import heapq
 import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import repeat
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
 import uuid
 from pathlib import Path
 
+from adaptation_cache import ADAPTATION_INPUT_FIELDS, AdaptationCache
+from content_blobs import BlobStore, diff_chunks, patch_chunks
+from content_formats import FORMAT_VERSION, check_format, decode_body, dumps_record, encode_body, loads_record
+from content_images import ImageRegistry
+from text_processing import meta_description, slugify, summarize
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Bump when the shape of index entries changes so stale indexes get rebuilt
+INDEX_VERSION = 1
+
+# Record fields copied into the metadata index
+INDEX_FIELDS = ["title", "slug", "status", "category", "tags", "modified_date"]
+
+# Index journal length at which its changes are folded into index.json
+INDEX_JOURNAL_COMPACT = 1000
+
+# Syndication log length at which events are folded into the content record
+SYNDICATION_COMPACT_EVENTS = 50
+
+# Every Nth revision stores the full body, bounding how many deltas a read replays
+REVISION_SNAPSHOT_INTERVAL = 20
+
+
+class _BatchState(threading.local):
+    """One thread's batch() nesting depth and the work deferred to its end"""
+    
+    def __init__(self):
+        self.depth = 0
+        self.index: Dict[str, Optional[Dict]] = {}
+        self.index_dirty = False
+        self.dir_syncs: set = set()
+
+
+class RevisionConflictError(ValueError):
+    """Raised when content changed on disk since the caller read it"""
+
+
+class LazyContent(dict):
+    """
+    Content object whose content_long is read from disk on first access
+    
+    Behaves like the plain dict returned by get_content(): the body is
+    loaded when content["content_long"] or content.get("content_long") is
+    used, and also by anything that sees the whole mapping (iteration,
+    keys/items/values, len, ==, copy, pickling, dict(content), {**content},
+    json.dumps), so nothing silently drops it. Storage code that must not
+    load it uses the dict.* methods directly.
+    """
+    
+    def __init__(self, *args, body_loader: Optional[Callable[[], str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._body_loader = body_loader
+    
+    def _load_body(self):
+        """Read content_long into the dict if it is still pending"""
+        if self._body_loader is not None and not super().__contains__("content_long"):
+            super().__setitem__("content_long", self._body_loader())
+        self._body_loader = None
+    
+    def __missing__(self, key):
+        if key == "content_long" and self._body_loader is not None:
+            self._load_body()
+            return super().__getitem__("content_long")
+        raise KeyError(key)
+    
+    def __contains__(self, key) -> bool:
+        if key == "content_long" and self._body_loader is not None:
+            return True
+        return super().__contains__(key)
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __setitem__(self, key, value):
+        if key == "content_long":
+            self._body_loader = None
+        super().__setitem__(key, value)
+    
+    def __delitem__(self, key):
+        self._load_body()
+        super().__delitem__(key)
+    
+    def pop(self, key, *default):
+        self._load_body()
+        return super().pop(key, *default)
+    
+    def popitem(self):
+        self._load_body()
+        return super().popitem()
+    
+    def setdefault(self, key, default=None):
+        self._load_body()
+        return super().setdefault(key, default)
+    
+    def __iter__(self):
+        self._load_body()
+        return super().__iter__()
+    
+    def __len__(self) -> int:
+        self._load_body()
+        return super().__len__()
+    
+    def keys(self):
+        self._load_body()
+        return super().keys()
+    
+    def items(self):
+        self._load_body()
+        return super().items()
+    
+    def values(self):
+        self._load_body()
+        return super().values()
+    
+    def __eq__(self, other) -> bool:
+        self._load_body()
+        if isinstance(other, LazyContent):
+            other._load_body()
+        return super().__eq__(other)
+    
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    __hash__ = None
+    
+    def __or__(self, other):
+        return self.copy() | other
+    
+    def __ror__(self, other):
+        return other | self.copy()
+    
+    def __repr__(self) -> str:
+        self._load_body()
+        return super().__repr__()
+    
+    def copy(self) -> Dict:
+        """Plain dict copy with the body loaded"""
+        self._load_body()
+        return dict(super().items())
+    
+    def __reduce_ex__(self, protocol):
+        # copy, deepcopy and pickle get a plain dict; the loader is a closure
+        return (dict, (self.copy(),))
+    
+    @property
+    def body_loaded(self) -> bool:
+        """Whether content_long has been read into memory"""
+        return super().__contains__("content_long")
+
+
+def with_revision(content: Dict, revision: int) -> Dict:
+    """Shallow copy of a content object at another revision; a lazy body stays unread"""
+    if isinstance(content, LazyContent):
+        copied = LazyContent(dict.items(content), body_loader=content._body_loader)
+    else:
+        copied = dict(content)
+    copied["revision"] = revision
+    return copied
+
+
+def parse_record(data: bytes) -> Dict:
+    """Parse a record file in any supported format, dropping the format marker"""
+    metadata = loads_record(data)
+    version = metadata.pop("_format", 1)
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"Content {metadata.get('content_id')} uses storage format {version}; "
+            f"this version reads up to {FORMAT_VERSION}"
+        )
+    return metadata
+
+
+def parse_events(data: bytes) -> List[Dict]:
+    """Parse JSONL event bytes, skipping a line torn by a crash mid-append"""
+    events = []
+    for line in data.splitlines():
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            continue
+    return events
+
+
+def apply_syndication_events(metadata: Dict, events: List[Dict]):
+    """Fold syndication log events into a record's syndication_status"""
+    if not events:
+        return
+    
+    syndication_status = metadata.setdefault("syndication_status", {})
+    for event in events:
+        syndication_status[event["platform"]] = {
+            "status": event["status"],
+            "url": event.get("url"),
+            "date": event["date"],
+            "error": event.get("error")
+        }
+
+
+def make_body_delta(old: str, new: str) -> List:
+    """
+    Encode new as line edits against old
+    
+    Returns:
+        Ops list: [start, end] copies old lines[start:end], a string is
+        inserted text
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(new_lines[j1:j2]))
+    return ops
+
+
+def apply_body_delta(old: str, ops: List) -> str:
+    """Rebuild a body from the one it was diffed against and make_body_delta ops"""
+    old_lines = old.splitlines(keepends=True)
+    parts = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.extend(old_lines[op[0]:op[1]])
+    return "".join(parts)
+
+
+def _load_record_chunk(paths: List[tuple], body_dirs: List[str], syndication_dir: str,
+                       blob_dir: str, include_body: bool) -> List[tuple]:
+    """
+    Read and parse a chunk of record files for the parallel loader
+    
+    Runs in worker threads or processes, so it only touches the filesystem
+    and never the manager's cache or index.
+    
+    Args:
+        paths: (record path, status) pairs
+        body_dirs: Directories searched for body sidecars, in order
+        syndication_dir: Directory holding the syndication logs
+        blob_dir: Root of the blob store, for bodies stored by reference
+        include_body: Read content_long from the sidecar or blob store
+        
+    Returns:
+        (stat, status, content) tuples, newest first
+    """
+    loaded = []
+    for path, status in paths:
+        try:
+            stat = os.stat(path)
+            with open(path, 'rb') as f:
+                content = parse_record(f.read())
+        except FileNotFoundError:
+            # Deleted or published since the directory was scanned
+            continue
+        
+        content_id = content["content_id"]
+        try:
+            with open(os.path.join(syndication_dir, f"{content_id}.log.jsonl"), 'rb') as f:
+                apply_syndication_events(content, parse_events(f.read()))
+        except FileNotFoundError:
+            pass
+        
+        if include_body and "content_long" not in content and "body_ref" in content:
+            content["content_long"] = BlobStore(blob_dir).get(content["body_ref"])
+        elif include_body and "content_long" not in content:
+            content["content_long"] = ""
+            for directory in body_dirs:
+                try:
+                    with open(os.path.join(directory, f"{content_id}.md"), 'rb') as f:
+                        content["content_long"] = decode_body(f.read())
+                    break
+                except FileNotFoundError:
+                    continue
+        
+        loaded.append((stat, status, content))
+    
+    loaded.sort(key=lambda item: item[2].get("modified_date", ""), reverse=True)
+    return loaded
+
 
 class ContentManager:
     """Manages content creation, storage, and retrieval"""
     
-    def __init__(self, base_dir: str = "content_data"):
+    def __init__(
+        self,
+        base_dir: str = "content_data",
+        cache_size: int = 256,
+        fsync: bool = True,
+        serializer: str = "pretty",
+        body_codec: str = "plain",
+        blob_store: bool = False,
+        blob_chunker: str = "paragraph"
+    ):
         self.base_dir = Path(base_dir)
         self.drafts_dir = self.base_dir / "drafts"
         self.published_dir = self.base_dir / "published"
         self.images_dir = self.base_dir / "images"
         self.templates_dir = self.base_dir / "templates"
+        self.syndication_dir = self.base_dir / "syndication"
+        self.locks_dir = self.base_dir / "locks"
+        self.revisions_dir = self.base_dir / "revisions"
+        self.index_path = self.base_dir / "index.json"
+        self.index_journal_path = self.base_dir / "index.journal.jsonl"
         
         # Create directories if they don't exist
-        for directory in [self.drafts_dir, self.published_dir, self.images_dir, self.templates_dir]:
+        for directory in [self.drafts_dir, self.published_dir, self.images_dir, self.templates_dir,
+                          self.syndication_dir, self.locks_dir, self.revisions_dir]:
             directory.mkdir(parents=True, exist_ok=True)
+        
+        # Metadata index and its stats counters, loaded lazily on first use.
+        # Saves append entry changes to the index journal, which is folded
+        # into index.json every INDEX_JOURNAL_COMPACT changes; the generation
+        # ties journal lines to the index.json they apply to
+        self._index: Optional[Dict[str, Dict]] = None
+        self._stats: Optional[Dict] = None
+        self._index_signature: Optional[tuple] = None
+        self._index_generation: Optional[str] = None
+        self._journal_position: Optional[tuple] = None
+        self._journal_entries = 0
+        
+        # Inverted indexes over the metadata index: key -> content IDs
+        self._by_slug: Optional[Dict[str, set]] = None
+        self._by_category: Optional[Dict[str, set]] = None
+        self._by_tag: Optional[Dict[str, set]] = None
+        
+        # LRU cache of parsed files: path -> ((mtime_ns, size), value)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        
+        # Durable writes; inside batch() the index write and directory
+        # fsyncs are deferred until the batch ends. Batches are per thread;
+        # _unflushed holds every thread's not yet written index changes so
+        # a reload of the index does not lose them
+        self.fsync = fsync
+        self._batch = _BatchState()
+        self._unflushed: Dict[str, Optional[Dict]] = {}
+        
+        # On-disk format for new writes; readers detect the format of existing files
+        check_format(serializer, body_codec)
+        self.serializer = serializer
+        self.body_codec = body_codec
+        
+        # Content-addressed store for bodies and revision snapshots. New bodies
+        # go there only when blob_store is set; bodies stored by reference
+        # are always readable.
+        self.blob_store = blob_store
+        self.blobs = BlobStore(self.base_dir / "blobs", chunker=blob_chunker, fsync=fsync)
+        
+        # Deduplicated image assets and the manifest of each item's images
+        self.images = ImageRegistry(self.images_dir, fsync=fsync)
+        
+        # Adapted output for ContentAdapter(cache=manager.adaptations);
+        # entries of a record are dropped when its adaptation inputs change
+        self.adaptations = AdaptationCache(self.base_dir / "adaptations")
+        
+        # Per-thread count of record locks held, so locking is re-entrant
+        self._held_locks = threading.local()
+        
+        # Guards the in-memory index and read cache when one manager is
+        # shared between threads (e.g. AsyncContentManager)
+        self._state_lock = threading.RLock()
     
     def create_content(
         self,
@@ -50,8 +422,27 @@ class ContentManager:
         Returns:
             Content object with metadata
         """
+        with self._slug_lock():
+            content = self._build_content(title, content_long, keywords, category, meta_description, tags, author)
+            
+            # Save as draft
+            content = self._save_content(content, is_draft=True)
+        
+        return content
+    
+    def _build_content(
+        self,
+        title: str,
+        content_long: str,
+        keywords: List[str],
+        category: str,
+        meta_description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        author: str = "Gera Yeremin"
+    ) -> Dict:
+        """Build a new, unsaved draft content object (see create_content)"""
         content_id = str(uuid.uuid4())
-        slug = self._generate_slug(title)
+        slug = self._generate_slug(title, content_id)
         
         # Auto-generate meta description if not provided
         if not meta_description:
@@ -81,49 +472,74 @@ class ContentManager:
                 "total_views": 0,
                 "total_engagements": 0,
                 "platform_performance": {}
-            }
+            },
+            "revision": 0
         }
         
-        # Save as draft
-        self._save_content(content, is_draft=True)
-        
         return content
     
-    def update_content(self, content_id: str, updates: Dict) -> Dict:
+    def update_content(self, content_id: str, updates: Dict, expected_revision: Optional[int] = None) -> Dict:
         """
         Update existing content
         
+        The read and write happen under the record lock, so concurrent
+        updates from other processes are applied one after another.
+        
         Args:
             content_id: ID of content to update
             updates: Dictionary of fields to update
+            expected_revision: Revision the caller based its edits on; if the
+                record has moved past it, RevisionConflictError is raised
             
         Returns:
             Updated content object
         """
-        content = self.get_content(content_id)
-        
-        if not content:
-            raise ValueError(f"Content with ID {content_id} not found")
-        
-        # Update fields
-        for key, value in updates.items():
-            if key in content and key not in ["content_id", "created_date"]:
-                content[key] = value
-        
-        # Update modified date
-        content["modified_date"] = datetime.now().isoformat()
-        
-        # Re-generate slug if title changed
-        if "title" in updates:
-            content["slug"] = self._generate_slug(updates["title"])
-        
-        # Re-generate summary if content changed
-        if "content_long" in updates:
-            content["content_summary"] = self._generate_summary(updates["content_long"])
+        # A new title means a new slug; the slug lock is taken before the
+        # record lock, as create_content and the importer do
+        slug_lock = self._slug_lock() if "title" in updates else nullcontext()
+        with slug_lock, self._record_lock(content_id):
+            content = self.get_content(content_id, include_body=False)
+            
+            if not content:
+                self._discard_record_lock(content_id)
+                raise ValueError(f"Content with ID {content_id} not found")
+            
+            if expected_revision is not None and content.get("revision", 0) != expected_revision:
+                raise RevisionConflictError(
+                    f"Content {content_id} is at revision {content.get('revision', 0)}, "
+                    f"expected {expected_revision}"
+                )
+            
+            # Bodies are not compared, so any content_long update counts as a change
+            inputs_changed = any(
+                key in ADAPTATION_INPUT_FIELDS and (key == "content_long" or content.get(key) != value)
+                for key, value in updates.items()
+            )
+            
+            # Update fields
+            for key, value in updates.items():
+                if key in content and key not in ["content_id", "created_date", "revision"]:
+                    content[key] = value
+            
+            # Update modified date
+            content["modified_date"] = datetime.now().isoformat()
+            
+            # Re-generate slug if title changed
+            if "title" in updates:
+                content["slug"] = self._generate_slug(updates["title"], content_id)
+            
+            # Re-generate summary if content changed
+            if "content_long" in updates:
+                content["content_summary"] = self._generate_summary(updates["content_long"])
+            
+            # Save updated content; a status change moves it to the other directory
+            is_draft = content["status"] == "draft"
+            content = self._save_content(content, is_draft=is_draft)
+            if "status" in updates:
+                self._discard_other_copy(content_id, is_draft)
         
-        # Save updated content
-        is_draft = content["status"] == "draft"
-        self._save_content(content, is_draft=is_draft)
+        if inputs_changed:
+            self.adaptations.invalidate(content_id)
         
         return content
     
@@ -138,74 +554,352 @@ class ContentManager:
         Returns:
             Published content object
         """
-        content = self.get_content(content_id)
-        
-        if not content:
-            raise ValueError(f"Content with ID {content_id} not found")
-        
-        content["status"] = "published"
-        content["published_date"] = datetime.now().isoformat()
-        content["canonical_url"] = canonical_url
-        
-        # Move from drafts to published
-        draft_path = self.drafts_dir / f"{content_id}.json"
-        if draft_path.exists():
-            draft_path.unlink()
+        with self._record_lock(content_id):
+            content = self.get_content(content_id, include_body=False)
+            
+            if not content:
+                self._discard_record_lock(content_id)
+                raise ValueError(f"Content with ID {content_id} not found")
+            
+            content["status"] = "published"
+            content["published_date"] = datetime.now().isoformat()
+            content["canonical_url"] = canonical_url
+            
+            # Move from drafts to published (the body file moves with it)
+            content = self._save_content(content, is_draft=False)
+            self._discard_other_copy(content_id, is_draft=False)
         
-        self._save_content(content, is_draft=False)
+        # The canonical URL is part of every adaptation
+        self.adaptations.invalidate(content_id)
         
         return content
     
-    def get_content(self, content_id: str) -> Optional[Dict]:
+    def _discard_other_copy(self, content_id: str, is_draft: bool):
+        """
+        Remove the record and body left in the other status directory after
+        content was saved as a draft (is_draft) or as published content
+        """
+        other_dir = self.published_dir if is_draft else self.drafts_dir
+        record_path = other_dir / f"{content_id}.json"
+        body_path = other_dir / f"{content_id}.md"
+        removed = False
+        for path in [record_path, body_path]:
+            if path.exists():
+                path.unlink()
+                removed = True
+        if removed:
+            self._sync_dir(other_dir)
+        self._cache_discard(record_path, body_path)
+    
+    def get_content(self, content_id: str, include_body: bool = True) -> Optional[Dict]:
         """
         Retrieve content by ID
         
         Args:
             content_id: Content ID
+            include_body: Read content_long now; when False a LazyContent is
+                returned that reads the body on first access
             
         Returns:
             Content object or None if not found
         """
-        # Check published first
-        published_path = self.published_dir / f"{content_id}.json"
-        if published_path.exists():
-            with open(published_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
-        # Check drafts
-        draft_path = self.drafts_dir / f"{content_id}.json"
-        if draft_path.exists():
-            with open(draft_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        # Check published first, then drafts
+        for directory in [self.published_dir, self.drafts_dir]:
+            content = self._load_record(directory / f"{content_id}.json", include_body)
+            if content is not None:
+                return content
         
         return None
     
-    def list_content(self, status: Optional[str] = None) -> List[Dict]:
+    def list_content(self, status: Optional[str] = None, include_body: bool = True,
+                     workers: int = 1, use_processes: bool = False,
+                     chunk_size: int = 256) -> List[Dict]:
         """
         List all content, optionally filtered by status
         
+        With workers > 1 the record files are read and parsed on a thread or
+        process pool straight from the directories, which is much faster
+        than the sequential path on a cold start (no index, empty cache).
+        
         Args:
             status: Filter by status ("draft" or "published"), or None for all
+            include_body: Read each content_long now, or lazily on access
+            workers: Number of parallel loaders; 1 reads sequentially
+            use_processes: Use a process pool instead of threads, so parsing
+                is not limited by the GIL
+            chunk_size: Records per work item for the parallel loader
             
         Returns:
-            List of content objects
+            List of content objects, newest first
         """
+        if workers > 1:
+            return self._list_content_parallel(status, include_body, workers, use_processes, chunk_size)
+        
         content_list = []
         
-        if status is None or status == "draft":
-            for file_path in self.drafts_dir.glob("*.json"):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content_list.append(json.load(f))
+        # The index already holds the sort order, so only the records are read
+        for entry in self.list_metadata(status):
+            file_path = self._status_dir(entry["status"]) / f"{entry['content_id']}.json"
+            content = self._load_record(file_path, include_body)
+            if content is not None:
+                content_list.append(content)
+        
+        return content_list
+    
+    def iter_content(
+        self,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        since: Optional[Union[str, datetime]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_body: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Iterate over content, newest first, reading each record as it is consumed
+        
+        Only the matching index keys are held in memory; records are read
+        one at a time and, unless include_body is set, their bodies are read
+        on first access. Pass page_cursor() of the last record received as
+        cursor to continue where a previous page stopped.
+        
+        Args:
+            status: Filter by status ("draft" or "published")
+            category: Filter by category
+            since: Only content modified at or after this time (ISO string or datetime)
+            limit: Maximum number of records to yield
+            cursor: Continue after the record this cursor was taken from
+            include_body: Read content_long now instead of lazily
+            
+        Yields:
+            Content objects ordered by modified_date, then content_id, descending
+        """
+        after = self._parse_cursor(cursor) if cursor else None
+        if isinstance(since, datetime):
+            since = since.isoformat()
+        
+        with self._state_lock:
+            index = self._reconcile_index()
+            if category is not None:
+                self._secondary_indexes()
+                candidates = [index[cid] for cid in self._by_category.get(category, ()) if cid in index]
+            else:
+                candidates = index.values()
+            
+            keys = []
+            for entry in candidates:
+                key = (entry["modified_date"] or "", entry["content_id"])
+                if status is not None and entry["status"] != status:
+                    continue
+                if since is not None and key[0] < since:
+                    continue
+                if after is not None and key >= after:
+                    continue
+                keys.append((key, entry["status"]))
+        
+        if limit is not None:
+            keys = heapq.nlargest(limit, keys)
+        else:
+            keys.sort(reverse=True)
+        
+        for (_, content_id), entry_status in keys:
+            content = self._load_record(self._status_dir(entry_status) / f"{content_id}.json", include_body)
+            if content is None:
+                # Published or deleted since the index snapshot was taken
+                content = self.get_content(content_id, include_body=include_body)
+            if content is not None:
+                yield content
+    
+    def page_cursor(self, content: Dict) -> str:
+        """
+        Cursor for resuming iter_content after this record
         
-        if status is None or status == "published":
-            for file_path in self.published_dir.glob("*.json"):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content_list.append(json.load(f))
+        Args:
+            content: A record yielded by iter_content
+            
+        Returns:
+            Opaque cursor string
+        """
+        return f"{content.get('modified_date') or ''}|{content['content_id']}"
+    
+    def _parse_cursor(self, cursor: str) -> tuple:
+        """Split a page_cursor() string into its (modified_date, content_id) key"""
+        modified_date, sep, content_id = cursor.rpartition("|")
+        if not sep or not content_id:
+            raise ValueError(f"Invalid page cursor: {cursor!r}")
+        return (modified_date, content_id)
+    
+    def list_metadata(self, status: Optional[str] = None) -> List[Dict]:
+        """
+        List content metadata from the index without reading content files
+        
+        Args:
+            status: Filter by status ("draft" or "published"), or None for all
+            
+        Returns:
+            List of index entries (id, title, slug, status, category, tags,
+            modified_date, total_views), newest first
+        """
+        with self._state_lock:
+            index = self._reconcile_index()
+            
+            entries = [
+                dict(entry) for entry in index.values()
+                if status is None or entry["status"] == status
+            ]
         
         # Sort by modified date (newest first)
-        content_list.sort(key=lambda x: x["modified_date"], reverse=True)
+        entries.sort(key=lambda x: x["modified_date"], reverse=True)
         
-        return content_list
+        return entries
+    
+    def get_by_slug(self, slug: str, include_body: bool = True) -> Optional[Dict]:
+        """
+        Retrieve content by slug
+        
+        Args:
+            slug: URL slug
+            include_body: Read content_long now, or lazily on first access
+            
+        Returns:
+            Content object or None if no content has this slug
+        """
+        # Prefer the published item if an old draft shares the slug
+        entries = self._entries_for(self._indexed_ids("_by_slug", slug))
+        for entry in sorted(entries, key=lambda e: e["status"] != "published"):
+            content = self.get_content(entry["content_id"], include_body=include_body)
+            if content is not None:
+                return content
+        return None
+    
+    def list_by_category(self, category: str) -> List[Dict]:
+        """
+        List content metadata in a category
+        
+        Args:
+            category: Category name
+            
+        Returns:
+            List of index entries, newest first
+        """
+        return self._entries_for(self._indexed_ids("_by_category", category))
+    
+    def list_by_tag(self, tag: str) -> List[Dict]:
+        """
+        List content metadata carrying a tag
+        
+        Args:
+            tag: Tag name
+            
+        Returns:
+            List of index entries, newest first
+        """
+        return self._entries_for(self._indexed_ids("_by_tag", tag))
+    
+    def _entries_for(self, content_ids: Iterable[str]) -> List[Dict]:
+        """Index entries for a set of IDs, newest first"""
+        with self._state_lock:
+            index = self._load_index()
+            entries = [dict(index[content_id]) for content_id in content_ids if content_id in index]
+            entries.sort(key=lambda x: x["modified_date"], reverse=True)
+            return entries
+    
+    def list_revisions(self, content_id: str) -> List[Dict]:
+        """
+        List the recorded revisions of a content item, oldest first
+        
+        Args:
+            content_id: Content ID
+            
+        Returns:
+            List of dicts with revision, date, title and kind ("snapshot"
+            or "delta")
+        """
+        revisions = []
+        fields: Dict = {}
+        for entry in self._read_revisions(content_id):
+            fields = self._apply_revision_fields(fields, entry)
+            revisions.append({
+                "revision": entry["revision"],
+                "date": entry["date"],
+                "title": fields.get("title"),
+                "kind": entry["kind"]
+            })
+        return revisions
+    
+    def get_revision(self, content_id: str, revision: int) -> Dict:
+        """
+        Rebuild a content item as it was saved at a revision
+        
+        Args:
+            content_id: Content ID
+            revision: Revision number from list_revisions()
+            
+        Returns:
+            Content object for that revision
+            
+        Raises:
+            ValueError: If the revision was not recorded
+        """
+        entries = self._read_revisions(content_id)
+        position = next((i for i, entry in enumerate(entries) if entry["revision"] == revision), None)
+        if position is None:
+            raise ValueError(f"Revision {revision} of content {content_id} not found")
+        
+        fields, body = self._replay_revisions(entries, position)
+        if isinstance(body, list):
+            body = self.blobs.assemble(body)
+        
+        # The parsed log is cached, so never hand out its nested values
+        return dict(copy.deepcopy(fields), content_long=body)
+    
+    def diff(self, content_id: str, a: int, b: int) -> str:
+        """
+        Unified diff of content_long between two revisions
+        
+        Args:
+            content_id: Content ID
+            a: Older revision
+            b: Newer revision
+            
+        Returns:
+            Diff text, empty if the bodies are identical
+        """
+        old = self.get_revision(content_id, a)["content_long"]
+        new = self.get_revision(content_id, b)["content_long"]
+        return "".join(difflib.unified_diff(
+            old.splitlines(keepends=True),
+            new.splitlines(keepends=True),
+            fromfile=f"revision {a}",
+            tofile=f"revision {b}"
+        ))
+    
+    def collect_blob_garbage(self) -> int:
+        """
+        Delete blob store chunks no record or revision refers to
+        
+        Bodies of deleted content stay in the blob store until this runs.
+        Run it while no other process is saving content.
+        
+        Returns:
+            Number of blobs deleted
+        """
+        refs = []
+        chunks = []
+        for path, _ in self._scan_record_paths():
+            metadata = self._read_cached(Path(path), self._parse_record)
+            if metadata is not None and "body_ref" in metadata:
+                refs.append(metadata["body_ref"])
+        
+        for log_path in self.revisions_dir.glob("*.jsonl"):
+            for entry in self._read_events(log_path):
+                if "body_ref" in entry:
+                    refs.append(entry["body_ref"])
+                for op in entry.get("chunk_ops", ()):
+                    if isinstance(op[0], str):
+                        chunks.append(op[0])
+        
+        return self.blobs.collect_garbage(refs, chunks)
     
     def delete_content(self, content_id: str) -> bool:
         """
@@ -217,26 +911,99 @@ class ContentManager:
         Returns:
             True if deleted, False if not found
         """
-        published_path = self.published_dir / f"{content_id}.json"
-        draft_path = self.drafts_dir / f"{content_id}.json"
-        
         deleted = False
         
-        if published_path.exists():
-            published_path.unlink()
-            deleted = True
+        with self._record_lock(content_id):
+            for directory in [self.published_dir, self.drafts_dir]:
+                record_path = directory / f"{content_id}.json"
+                if record_path.exists():
+                    record_path.unlink()
+                    deleted = True
+                
+                body_path = directory / f"{content_id}.md"
+                if body_path.exists():
+                    body_path.unlink()
+                
+                self._cache_discard(record_path, body_path)
+                self._sync_dir(directory)
+            
+            for log_path in [self._syndication_log_path(content_id), self._syndication_history_path(content_id),
+                             self._revision_log_path(content_id)]:
+                if log_path.exists():
+                    log_path.unlink()
+                self._cache_discard(log_path)
+            
+            self._discard_record_lock(content_id)
+        
+        if deleted:
+            self._remove_from_index(content_id)
+        
+        self._delete_images(content_id)
+        self.adaptations.invalidate(content_id)
+        
+        return deleted
+    
+    def add_image(self, content_id: str, source: str, name: Optional[str] = None, alt: str = "") -> Dict:
+        """
+        Attach an image file to a content item
+        
+        Identical files are stored once however many items use them. Adding
+        a file in another format under an existing name (e.g. the webp of a
+        png) records it as a variant of that image.
+        
+        Args:
+            content_id: Content ID
+            source: Path of the image file
+            name: Image name (defaults to the file name without extension)
+            alt: Alt text
+            
+        Returns:
+            Image dict with name, alt, added and formats (format -> sha256,
+            width, height, bytes and path relative to the images directory)
+            
+        Raises:
+            ValueError: If content not found or the file is not a supported image
+        """
+        if not self._record_exists(content_id):
+            raise ValueError(f"Content {content_id} not found")
+        
+        with self._record_lock("images"):
+            return self.images.add(content_id, source, name=name, alt=alt)
+    
+    def get_images(self, content_id: str) -> List[Dict]:
+        """
+        Get the images attached to a content item
         
-        if draft_path.exists():
-            draft_path.unlink()
-            deleted = True
+        Args:
+            content_id: Content ID
+            
+        Returns:
+            Image dicts as returned by add_image, in the order added
+        """
+        return self.images.get(content_id)
+    
+    def remove_image(self, content_id: str, name: str) -> bool:
+        """
+        Detach one image from a content item
         
-        # Delete associated images directory
+        Args:
+            content_id: Content ID
+            name: Image name
+            
+        Returns:
+            True if removed, False if the item had no such image
+        """
+        with self._record_lock("images"):
+            return self.images.remove(content_id, name) > 0
+    
+    def _delete_images(self, content_id: str):
+        """Delete the images directory associated with a content item"""
+        with self._record_lock("images"):
+            self.images.remove(content_id)
         images_path = self.images_dir / content_id
         if images_path.exists():
             import shutil
             shutil.rmtree(images_path)
-        
-        return deleted
     
     def update_syndication_status(
         self,
@@ -259,44 +1026,1169 @@ class ContentManager:
         Returns:
             Updated content object
         """
-        content = self.get_content(content_id)
+        with self._record_lock(content_id):
+            if not self._record_exists(content_id):
+                self._discard_record_lock(content_id)
+                raise ValueError(f"Content with ID {content_id} not found")
+            
+            self._append_syndication_events(
+                content_id, [self._syndication_event(platform, status, url, error)]
+            )
         
-        if not content:
-            raise ValueError(f"Content with ID {content_id} not found")
+        return self.get_content(content_id, include_body=False)
+    
+    def bulk_update_syndication_status(self, updates: Iterable[tuple]) -> Dict[str, Dict]:
+        """
+        Apply many syndication status updates with one log append per content
         
-        content["syndication_status"][platform] = {
+        Updates are grouped by content ID and applied in order, so fanning
+        one post out to six platforms is a single append instead of six.
+        
+        Args:
+            updates: Tuples of (content_id, platform, status[, url[, error]])
+            
+        Returns:
+            Updated content objects keyed by content ID
+        """
+        grouped: Dict[str, List[Dict]] = {}
+        for update in updates:
+            content_id, platform, status, *rest = update
+            url = rest[0] if len(rest) > 0 else None
+            error = rest[1] if len(rest) > 1 else None
+            grouped.setdefault(content_id, []).append(
+                self._syndication_event(platform, status, url, error)
+            )
+        
+        # Check everything first so an unknown ID fails before anything is written
+        for content_id in grouped:
+            if not self._record_exists(content_id):
+                raise ValueError(f"Content with ID {content_id} not found")
+        
+        with self.batch():
+            for content_id, events in grouped.items():
+                with self._record_lock(content_id):
+                    self._append_syndication_events(content_id, events)
+        
+        return {content_id: self.get_content(content_id, include_body=False) for content_id in grouped}
+    
+    def get_syndication_history(self, content_id: str, platform: Optional[str] = None) -> List[Dict]:
+        """
+        Get every recorded syndication event, oldest first
+        
+        Args:
+            content_id: Content ID
+            platform: Only return events for this platform
+            
+        Returns:
+            List of events with platform, status, url, error and date
+        """
+        events = (self._read_events(self._syndication_history_path(content_id))
+                  + self._read_events(self._syndication_log_path(content_id)))
+        return [dict(event) for event in events if platform is None or event["platform"] == platform]
+    
+    def compact_syndication_log(self, content_id: str):
+        """
+        Fold the live syndication log into the content record
+        
+        The folded events are appended to the history file first, so
+        get_syndication_history() still returns every retry.
+        
+        Args:
+            content_id: Content ID
+        """
+        log_path = self._syndication_log_path(content_id)
+        
+        # Appends take the same lock, so no event lands between read and unlink
+        with self._record_lock(content_id):
+            if not log_path.exists():
+                return
+            
+            content = self.get_content(content_id, include_body=False)
+            if content is None:
+                self._discard_record_lock(content_id)
+                return
+            
+            with open(log_path, 'r', encoding='utf-8') as f:
+                log_text = f.read()
+            with open(self._syndication_history_path(content_id), 'a', encoding='utf-8') as f:
+                f.write(log_text)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            
+            # get_content() already materialized the log into syndication_status
+            is_draft = content["status"] == "draft"
+            self._save_content(content, is_draft=is_draft)
+            
+            log_path.unlink()
+            self._cache_discard(log_path)
+            self._sync_dir(self.syndication_dir)
+    
+    def compact_syndication_logs(self) -> int:
+        """
+        Compact every content item's syndication log
+        
+        Returns:
+            Number of logs compacted
+        """
+        compacted = 0
+        with self.batch():
+            for log_path in self.syndication_dir.glob("*.log.jsonl"):
+                self.compact_syndication_log(log_path.name[:-len(".log.jsonl")])
+                compacted += 1
+        return compacted
+    
+    def _syndication_event(self, platform: str, status: str, url: Optional[str], error: Optional[str]) -> Dict:
+        """Build one syndication log event"""
+        return {
+            "platform": platform,
             "status": status,
             "url": url,
             "date": datetime.now().isoformat(),
             "error": error
         }
+    
+    def _append_syndication_events(self, content_id: str, events: List[Dict]):
+        """Append events to the content's log, compacting it once it grows long; caller holds the record lock"""
+        log_path = self._syndication_log_path(content_id)
+        self._append_jsonl(log_path, events)
         
-        is_draft = content["status"] == "draft"
-        self._save_content(content, is_draft=is_draft)
+        if len(self._read_events(log_path)) >= SYNDICATION_COMPACT_EVENTS:
+            self.compact_syndication_log(content_id)
+    
+    def _apply_syndication_log(self, metadata: Dict):
+        """Materialize syndication_status from the stored status plus the live log"""
+        events = self._read_events(self._syndication_log_path(metadata["content_id"]))
+        apply_syndication_events(metadata, events)
+    
+    def _read_events(self, log_path: Path) -> List[Dict]:
+        """Read a JSONL event file, skipping a line torn by a crash mid-append"""
+        return self._read_cached(log_path, parse_events) or []
+    
+    def _syndication_log_path(self, content_id: str) -> Path:
+        """Live, not yet compacted syndication events"""
+        return self.syndication_dir / f"{content_id}.log.jsonl"
+    
+    def _syndication_history_path(self, content_id: str) -> Path:
+        """Events already folded into the content record"""
+        return self.syndication_dir / f"{content_id}.history.jsonl"
+    
+    def _record_exists(self, content_id: str) -> bool:
+        """Whether a draft or published record exists for content_id"""
+        return any(
+            (directory / f"{content_id}.json").exists()
+            for directory in [self.published_dir, self.drafts_dir]
+        )
+    
+    def _save_content(self, content: Dict, is_draft: bool = True) -> Dict:
+        """
+        Save content to appropriate directory
         
-        return content
+        Metadata goes to <id>.json and content_long to the <id>.md sidecar,
+        or to the blob store (referenced by body_ref) when it is enabled.
+        A LazyContent whose body was never read keeps its existing body.
+        The save only succeeds if the record is still at the revision the
+        content was read at (see _check_revision), and is recorded in the
+        revision history.
+        
+        Returns:
+            The saved content at its new revision; the caller's object is
+            left unchanged
+        """
+        with self._record_lock(content["content_id"]):
+            saved = self._check_revision(content)
+            self._write_content(saved, is_draft)
+            self._record_revision(saved)
+        return saved
     
-    def _save_content(self, content: Dict, is_draft: bool = True):
-        """Save content to appropriate directory"""
+    def _check_revision(self, content: Dict) -> Dict:
+        """
+        Compare-and-swap guard: the stored revision must still be the one
+        the caller read
+        
+        Returns:
+            A copy of content at the next revision
+        
+        Raises:
+            RevisionConflictError: If another writer saved in the meantime
+        """
+        expected = content.get("revision", 0)
+        current = self._stored_revision(content["content_id"])
+        if current != expected:
+            raise RevisionConflictError(
+                f"Content {content['content_id']} is at revision {current}, expected {expected}"
+            )
+        return with_revision(content, expected + 1)
+    
+    def _stored_revision(self, content_id: str) -> int:
+        """Revision of the record on disk, 0 if it does not exist yet"""
+        # Read past the cache: the compare-and-swap must see the file as it is now
+        for directory in [self.published_dir, self.drafts_dir]:
+            try:
+                with open(directory / f"{content_id}.json", 'rb') as f:
+                    metadata = self._parse_record(f.read())
+            except FileNotFoundError:
+                continue
+            return metadata.get("revision", 0)
+        return 0
+    
+    def _write_content(self, content: Dict, is_draft: bool):
+        """Write the record and body files; caller holds the record lock"""
         target_dir = self.drafts_dir if is_draft else self.published_dir
-        file_path = target_dir / f"{content['content_id']}.json"
+        content_id = content["content_id"]
+        file_path = target_dir / f"{content_id}.json"
+        body_path = target_dir / f"{content_id}.md"
+        
+        # dict.items() skips an unloaded lazy body
+        metadata = {key: value for key, value in dict.items(content) if key != "content_long"}
+        
+        if dict.__contains__(content, "content_long") and self.blob_store:
+            ref = self.blobs.put(content["content_long"])
+            content["body_ref"] = metadata["body_ref"] = ref
+            self._cache_store(f"blob:{ref}", (0, 0), content["content_long"])
+            # A sidecar written before the blob store was enabled is now stale
+            for directory in [self.drafts_dir, self.published_dir]:
+                stale_path = directory / f"{content_id}.md"
+                if stale_path.exists():
+                    stale_path.unlink()
+                    self._cache_discard(stale_path)
+                    self._sync_dir(directory)
+        elif dict.__contains__(content, "content_long"):
+            self._atomic_write(body_path, encode_body(content["content_long"], self.body_codec))
+            self._cache_put(body_path, content["content_long"])
+            content.pop("body_ref", None)
+            metadata.pop("body_ref", None)
+        else:
+            # Body untouched; carry the sidecar over if the record changed directory
+            other_dir = self.published_dir if is_draft else self.drafts_dir
+            other_body_path = other_dir / f"{content_id}.md"
+            if not body_path.exists() and other_body_path.exists():
+                os.replace(other_body_path, body_path)
+                self._cache_discard(other_body_path)
+                self._sync_dir(other_dir)
+        
+        # Record last, so it never points at a body that was not written
+        marked = dict(metadata, _format=FORMAT_VERSION)
+        self._atomic_write(file_path, dumps_record(marked, self.serializer))
+        # Write-through so the next read of this record is a cache hit
+        self._cache_put(file_path, copy.deepcopy(metadata))
+        
+        self._update_index(content, file_path)
+    
+    @contextmanager
+    def _record_lock(self, content_id: str):
+        """
+        Hold an exclusive advisory lock on one content record
+        
+        The lock is a file under content_data/locks, so it serializes
+        writers across threads and processes. It is re-entrant within
+        a thread. A lock file removed by _discard_record_lock() while
+        another writer waited on it is detected, and that writer locks
+        the path's new file instead.
+        """
+        held = self._held_locks.__dict__.setdefault("counts", {})
+        if held.get(content_id):
+            held[content_id] += 1
+            try:
+                yield
+            finally:
+                held[content_id] -= 1
+            return
+        
+        lock_path = self.locks_dir / f"{content_id}.lock"
+        while True:
+            lock_file = open(lock_path, 'a+b')
+            if fcntl is None:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                if os.stat(lock_path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            lock_file.close()
+        
+        discard = self._held_locks.__dict__.setdefault("discard", set())
+        held[content_id] = 1
+        try:
+            yield
+        finally:
+            held[content_id] = 0
+            with lock_file:
+                if content_id in discard:
+                    discard.remove(content_id)
+                    # Unlinked before unlocking, so waiters on this file see it is gone and retry
+                    if lock_path.exists():
+                        lock_path.unlink()
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    
+    def _discard_record_lock(self, content_id: str):
+        """
+        Remove a record's lock file when the held lock is released
+        
+        Called for records that were deleted or never existed, so
+        locks/ does not keep a file per ID ever locked. The caller holds
+        the record lock.
+        """
+        if fcntl is None:
+            # Windows cannot remove a file that is open
+            return
+        self._held_locks.__dict__.setdefault("discard", set()).add(content_id)
+    
+    @contextmanager
+    def _slug_lock(self):
+        """
+        Hold the lock every slug assignment is made under
+        
+        Other managers may have saved content since this one last looked,
+        so the slug index is brought up to date when the lock is first
+        taken. Hold it from choosing a slug until the record is saved.
+        """
+        with self._record_lock("slugs"):
+            if self._held_locks.counts["slugs"] == 1:
+                self._refresh_slugs()
+            yield
+    
+    def _refresh_slugs(self):
+        """Pick up slugs saved by other managers"""
+        self._secondary_indexes()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group many saves behind one index write and one fsync per directory
+        
+        Each file is still written to a temp file, fsynced and renamed into
+        place, so every record is either old or new after a crash; only the
+        directory fsyncs and the index rewrite are batched. A batch covers
+        the saves of the thread that opened it; other threads sharing the
+        manager keep writing through as usual.
+        
+        Example:
+            with manager.batch():
+                for content_id in ids:
+                    manager.update_content(content_id, {"category": "Guides"})
+        """
+        self._batch.depth += 1
+        try:
+            yield self
+        finally:
+            self._batch.depth -= 1
+            if self._batch.depth == 0:
+                self._flush_batch()
+    
+    def _flush_batch(self):
+        """Write this thread's deferred index changes and fsync directories touched by the batch"""
+        batch = self._batch
+        if batch.index_dirty or batch.index:
+            with self._state_lock, self._record_lock("index"):
+                # Pick up what others saved during the batch, then put this
+                # batch's changes back on top
+                self._load_index()
+                for content_id, entry in batch.index.items():
+                    self._set_index_entry(content_id, entry)
+                if batch.index_dirty:
+                    self._write_index()
+                else:
+                    self._append_index_journal(batch.index)
+                for content_id, entry in batch.index.items():
+                    if self._unflushed.get(content_id, entry) is entry:
+                        self._unflushed.pop(content_id, None)
+        batch.index = {}
+        batch.index_dirty = False
+        for directory in batch.dir_syncs:
+            self._fsync_dir(directory)
+        batch.dir_syncs.clear()
+    
+    def _atomic_write(self, file_path: Path, data: bytes):
+        """Replace file_path with data so readers never see a partial file"""
+        tmp_path = file_path.with_name(
+            f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+        
+        self._sync_dir(file_path.parent)
+    
+    def _sync_dir(self, directory: Path):
+        """Make renames and unlinks in directory durable, now or at batch end"""
+        if not self.fsync:
+            return
+        if self._batch.depth:
+            self._batch.dir_syncs.add(directory)
+        else:
+            self._fsync_dir(directory)
+    
+    def _fsync_dir(self, directory: Path):
+        """fsync a directory entry table (not supported on Windows)"""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def _list_content_parallel(self, status: Optional[str], include_body: bool, workers: int,
+                               use_processes: bool, chunk_size: int) -> List[Dict]:
+        """
+        Load records on a worker pool and merge the chunks by modified date
+        
+        Each chunk comes back sorted, so the result is a k-way heapq.merge
+        rather than a full sort. The index is refreshed from the loaded
+        records, which saves the next call a reconciliation pass.
+        """
+        paths = self._scan_record_paths(status)
+        chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+        body_dirs = [str(self.published_dir), str(self.drafts_dir)]
+        
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=workers) as executor:
+            results = list(executor.map(
+                _load_record_chunk,
+                chunks,
+                repeat(body_dirs),
+                repeat(str(self.syndication_dir)),
+                repeat(str(self.blobs.root)),
+                repeat(include_body)
+            ))
+        
+        loaded = list(heapq.merge(
+            *results,
+            key=lambda item: item[2].get("modified_date", ""),
+            reverse=True
+        ))
+        self._refresh_index(loaded, complete=status is None)
+        
+        content_list = []
+        for _, _, content in loaded:
+            if "content_long" not in content:
+                content_id = content["content_id"]
+                body_ref = content.get("body_ref")
+                content = LazyContent(
+                    content, body_loader=lambda cid=content_id, ref=body_ref: self._read_body(cid, ref)
+                )
+            content_list.append(content)
+        return content_list
+    
+    def _scan_record_paths(self, status: Optional[str] = None) -> List[tuple]:
+        """
+        List (record path, status) pairs from the content directories
+        
+        A draft left behind next to its published copy is skipped so each
+        content ID appears once.
+        """
+        found = {}
+        # Published is scanned last so it wins if an id exists in both
+        for dir_status, directory in [("draft", self.drafts_dir), ("published", self.published_dir)]:
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    if dir_entry.name.endswith(".json"):
+                        found[dir_entry.name] = (dir_entry.path, dir_status)
+        
+        return [
+            (path, dir_status) for path, dir_status in found.values()
+            if status is None or dir_status == status
+        ]
+    
+    def _refresh_index(self, loaded: List[tuple], complete: bool):
+        """
+        Update index entries from records the parallel loader just read
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, indent=2, ensure_ascii=False)
+        Args:
+            loaded: (stat, status, content) tuples
+            complete: Whether loaded covers every record, so entries for
+                anything missing can be dropped
+        """
+        with self._state_lock, self._record_lock("index"):
+            index = self._load_index()
+            changed = False
+            seen = set()
+            
+            for stat, status, content in loaded:
+                content_id = content["content_id"]
+                seen.add(content_id)
+                entry = index.get(content_id)
+                if (entry is not None and entry["status"] == status
+                        and entry["mtime_ns"] == stat.st_mtime_ns
+                        and entry["size"] == stat.st_size):
+                    continue
+                index[content_id] = self._index_entry(content, status, stat)
+                changed = True
+            
+            if complete:
+                for content_id in [cid for cid in index if cid not in seen]:
+                    del index[content_id]
+                    changed = True
+            
+            if changed or self._stats is None:
+                self._stats = self._compute_stats(index.values())
+                self._write_index()
+            
+            if changed or self._by_slug is None:
+                self._build_secondary_indexes(index.values())
     
-    def _generate_slug(self, title: str) -> str:
-        """Generate URL-friendly slug from title"""
-        import re
+    def _load_record(self, file_path: Path, include_body: bool = True) -> Optional[Dict]:
+        """
+        Load a content record, attaching its body from the sidecar file
+        
+        Records written before bodies moved to sidecars still carry
+        content_long inline and are returned as-is.
+        
+        Returns:
+            Content object, or None if file_path does not exist
+        """
+        metadata = self._read_cached(file_path, self._parse_record)
+        if metadata is None:
+            return None
+        
+        # Callers mutate what they get back, so never hand out the cached dict
+        metadata = copy.deepcopy(metadata)
+        self._apply_syndication_log(metadata)
         
-        # Convert to lowercase
-        slug = title.lower()
+        if "content_long" in metadata:
+            return metadata
         
-        # Replace spaces and special chars with hyphens
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[\s_]+', '-', slug)
-        slug = re.sub(r'^-+|-+$', '', slug)
+        content_id = metadata["content_id"]
+        body_ref = metadata.get("body_ref")
+        if include_body:
+            metadata["content_long"] = self._read_body(content_id, body_ref)
+            return metadata
         
-        return slug
+        return LazyContent(metadata, body_loader=lambda: self._read_body(content_id, body_ref))
+    
+    def _read_body(self, content_id: str, body_ref: Optional[str] = None) -> str:
+        """Read content_long from the blob store or the sidecar file, wherever the record lives"""
+        if body_ref is not None:
+            return self._read_blob(body_ref)
+        
+        for directory in [self.published_dir, self.drafts_dir]:
+            body = self._read_cached(directory / f"{content_id}.md", decode_body)
+            if body is not None:
+                return body
+        return ""
+    
+    def _read_blob(self, ref: str) -> str:
+        """Read a body from the blob store through the LRU cache"""
+        # Blobs never change, so the cache signature is fixed
+        key = f"blob:{ref}"
+        with self._state_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached[1]
+            self._cache_misses += 1
+        
+        body = self.blobs.get(ref)
+        self._cache_store(key, (0, 0), body)
+        return body
+    
+    def _parse_record(self, data: bytes) -> Dict:
+        """Parse a record file in any supported format, dropping the format marker"""
+        return parse_record(data)
+    
+    # Revision history
+    
+    def _record_revision(self, content: Dict):
+        """
+        Append the just-saved state to the revision history; caller holds the record lock
+        
+        Most revisions store only the changed fields and a line delta of the
+        body against the previous revision. A full snapshot is stored every
+        REVISION_SNAPSHOT_INTERVAL revisions, when there is no previous
+        revision to diff against, or when the delta would not be smaller.
+        With the blob store, snapshots hold a body reference and deltas
+        edit the list of chunks, so each distinct paragraph is stored once.
+        """
+        content_id = content["content_id"]
+        revision = content["revision"]
+        # Entries carry the body themselves, so the record's body_ref is left out
+        fields = {key: value for key, value in dict.items(content) if key not in ("content_long", "body_ref")}
+        
+        entry = None
+        entries = self._read_revisions(content_id)
+        if entries and entries[-1]["revision"] == revision - 1 and revision % REVISION_SNAPSHOT_INTERVAL:
+            entry = self._revision_delta(entries, content, fields)
+        
+        if entry is None:
+            entry = {"kind": "snapshot", "fields": fields}
+            body_ref = content.get("body_ref")
+            if body_ref is None and self.blob_store:
+                body_ref = self.blobs.put(content["content_long"])
+            if body_ref is not None:
+                # Snapshots share chunks with the body and with each other
+                entry["body_ref"] = body_ref
+            else:
+                entry["body"] = content["content_long"]
+        
+        entry = dict(entry, revision=revision, date=content.get("modified_date"))
+        self._append_revision(content_id, entry)
+    
+    def _revision_delta(self, entries: List[Dict], content: Dict, fields: Dict) -> Optional[Dict]:
+        """Delta entry from the last recorded revision, or None if a snapshot is smaller"""
+        previous_fields, previous_body = self._replay_revisions(entries, len(entries) - 1)
+        
+        delta = {
+            "kind": "delta",
+            "fields": {
+                key: value for key, value in fields.items()
+                if key not in previous_fields or previous_fields[key] != value
+            },
+            "removed": [key for key in previous_fields if key not in fields]
+        }
+        
+        body_ref = content.get("body_ref")
+        if self.blob_store and body_ref is not None:
+            if not isinstance(previous_body, list):
+                # History from before the blob store was enabled
+                return None
+            chunks = self.blobs.chunks(body_ref)
+            if chunks != previous_body:
+                delta["chunk_ops"] = diff_chunks(previous_body, chunks)
+            return delta
+        
+        # An unread lazy body was not changed by this save
+        if not dict.__contains__(content, "content_long"):
+            return delta
+        if isinstance(previous_body, list):
+            previous_body = self.blobs.assemble(previous_body)
+        if content["content_long"] == previous_body:
+            return delta
+        
+        ops = make_body_delta(previous_body, content["content_long"])
+        if sum(len(op) for op in ops if isinstance(op, str)) >= len(content["content_long"]):
+            return None
+        delta["body_ops"] = ops
+        return delta
+    
+    def _replay_revisions(self, entries: List[Dict], position: int) -> tuple:
+        """
+        Rebuild the state at entries[position] from the nearest snapshot before it
+        
+        Returns:
+            (fields, body) where body is text, or a blob store chunk list
+            for history kept in the blob store
+        """
+        start = position
+        while entries[start]["kind"] != "snapshot":
+            start -= 1
+        
+        fields: Dict = {}
+        body = ""
+        for entry in entries[start:position + 1]:
+            fields, body = self._apply_revision(fields, body, entry)
+        return fields, body
+    
+    def _apply_revision(self, fields: Dict, body, entry: Dict) -> tuple:
+        """Advance a (fields, body) state by one revision entry"""
+        if entry["kind"] == "snapshot":
+            body = entry["body"] if "body" in entry else self.blobs.chunks(entry["body_ref"])
+            return dict(entry["fields"]), body
+        if "chunk_ops" in entry:
+            body = patch_chunks(body, entry["chunk_ops"])
+        elif "body_ops" in entry:
+            if isinstance(body, list):
+                body = self.blobs.assemble(body)
+            body = apply_body_delta(body, entry["body_ops"])
+        return self._apply_revision_fields(fields, entry), body
+    
+    def _apply_revision_fields(self, fields: Dict, entry: Dict) -> Dict:
+        """Advance the metadata fields by one revision entry"""
+        if entry["kind"] == "snapshot":
+            return dict(entry["fields"])
+        fields = dict(fields, **entry["fields"])
+        for key in entry.get("removed", []):
+            fields.pop(key, None)
+        return fields
+    
+    def _append_revision(self, content_id: str, entry: Dict):
+        """Append one entry to the content's revision log"""
+        self._append_jsonl(self._revision_log_path(content_id), [entry])
+    
+    def _read_revisions(self, content_id: str) -> List[Dict]:
+        """Revision log entries, oldest first"""
+        return self._read_events(self._revision_log_path(content_id))
+    
+    def _revision_log_path(self, content_id: str) -> Path:
+        """Revision history of one content item"""
+        return self.revisions_dir / f"{content_id}.jsonl"
+    
+    def _append_jsonl(self, log_path: Path, entries: List[Dict]):
+        """Append JSON lines to a log file in one write"""
+        lines = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    
+    # Read cache
+    
+    def cache_info(self) -> Dict:
+        """
+        Get read cache counters
+        
+        Returns:
+            Hits, misses, evictions, current size and maximum size
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+            "size": len(self._cache),
+            "max_size": self.cache_size
+        }
+    
+    def clear_cache(self):
+        """Drop all cached files and reset the counters"""
+        self._cache.clear()
+        self._cache_hits = self._cache_misses = self._cache_evictions = 0
+    
+    def _read_cached(self, file_path: Path, reader: Callable[[bytes], object]):
+        """
+        Read and decode a file's bytes through the LRU cache
+        
+        A cached value is used only while the file's mtime, size and inode
+        are unchanged. Files are replaced by rename, so every write by
+        another process gets a new inode, even one within the mtime
+        granularity that leaves the size unchanged.
+        
+        Returns:
+            The decoded value, or None if the file does not exist
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        
+        key = str(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._state_lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == signature:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached[1]
+            self._cache_misses += 1
+        
+        with open(file_path, 'rb') as f:
+            value = reader(f.read())
+        self._cache_store(key, signature, value)
+        return value
+    
+    def _cache_put(self, file_path: Path, value):
+        """Cache a value for a file that was just written"""
+        if self.cache_size <= 0:
+            return
+        stat = os.stat(file_path)
+        self._cache_store(str(file_path), (stat.st_mtime_ns, stat.st_size, stat.st_ino), value)
+    
+    def _cache_store(self, key: str, signature: tuple, value):
+        """Insert into the cache, evicting least recently used entries"""
+        if self.cache_size <= 0:
+            return
+        with self._state_lock:
+            self._cache[key] = (signature, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._cache_evictions += 1
+    
+    def _cache_discard(self, *file_paths: Path):
+        """Forget cached values for removed or moved files"""
+        with self._state_lock:
+            for file_path in file_paths:
+                self._cache.pop(str(file_path), None)
+    
+    def _status_dir(self, status: str) -> Path:
+        """Directory holding content files for a status"""
+        return self.drafts_dir if status == "draft" else self.published_dir
+    
+    # Metadata index
+    
+    def _index_entry(self, content: Dict, status: str, stat: os.stat_result) -> Dict:
+        """Build an index entry from a content record and its file stat"""
+        entry = {"content_id": content["content_id"]}
+        for field in INDEX_FIELDS:
+            entry[field] = content.get(field)
+        entry["status"] = status
+        entry["total_views"] = content.get("analytics", {}).get("total_views", 0)
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        return entry
+    
+    def _load_index(self) -> Dict[str, Dict]:
+        """
+        Load the on-disk index, starting empty if missing or outdated
+        
+        The in-memory copy is reused while index.json is unchanged (one
+        stat), and changes other processes appended to the journal since
+        the last load are applied on top. Inside this thread's batch()
+        nothing is reloaded until the batch ends.
+        """
+        if self._index is None or (
+            not self._batch.depth and self._index_file_signature() != self._index_signature
+        ):
+            self._read_index_file()
+        elif not self._batch.depth:
+            self._read_index_journal()
+        return self._index
+    
+    def _read_index_file(self):
+        """Replace the in-memory index and counters with index.json plus its journal"""
+        self._index = {}
+        self._stats = None
+        self._index_generation = None
+        self._index_signature = self._index_file_signature()
+        if self._index_signature is not None:
+            try:
+                with open(self.index_path, 'rb') as f:
+                    data = loads_record(f.read())
+                if data.get("version") == INDEX_VERSION:
+                    self._index = data.get("entries", {})
+                    self._stats = data.get("stats")
+                    self._index_generation = data.get("generation")
+            except (OSError, ValueError):
+                # A corrupt index is rebuilt by the next reconciliation
+                pass
+        if self._by_slug is not None:
+            self._build_secondary_indexes(self._index.values())
+        
+        self._journal_position = None
+        self._journal_entries = 0
+        self._read_index_journal()
+        for content_id, entry in self._unflushed.items():
+            self._set_index_entry(content_id, entry)
+    
+    def _read_index_journal(self):
+        """Apply index journal lines appended since the last read"""
+        try:
+            stat = os.stat(self.index_journal_path)
+        except FileNotFoundError:
+            return
+        position = self._journal_position
+        if position is not None and position == (stat.st_ino, stat.st_size):
+            return
+        
+        offset = 0
+        if position is not None:
+            if position[0] != stat.st_ino:
+                # Only a compaction replaces the journal, and it rewrote index.json first
+                self._read_index_file()
+                return
+            offset = position[1]
+        
+        with open(self.index_journal_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        # A line without its newline is still being appended (or was torn by a crash)
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                change = json.loads(line)
+            except ValueError:
+                continue
+            # Lines left over from before the last compaction are already in index.json
+            if change.get("generation") != self._index_generation or self._index_generation is None:
+                continue
+            self._set_index_entry(change["content_id"], change["entry"])
+            self._journal_entries += 1
+        self._journal_position = (stat.st_ino, offset + end)
+    
+    def _append_index_journal(self, changes: Dict[str, Optional[Dict]]):
+        """
+        Persist index entry changes by appending them to the journal
+        
+        Callers hold the "index" lock and loaded the index under it. Once
+        the journal reaches INDEX_JOURNAL_COMPACT changes it is folded
+        into index.json.
+        """
+        if not changes:
+            return
+        if self._index_generation is None:
+            # No index.json (or an outdated one) to journal against yet
+            self._write_index()
+            return
+        
+        data = "".join(
+            json.dumps({"generation": self._index_generation, "content_id": content_id, "entry": entry},
+                       ensure_ascii=False) + "\n"
+            for content_id, entry in changes.items()
+        ).encode("utf-8")
+        with open(self.index_journal_path, 'ab') as f:
+            stat = os.fstat(f.fileno())
+            offset = self._journal_position[1] if self._journal_position is not None else 0
+            if stat.st_size != offset:
+                # Drop a line torn by a crash mid-append so this one starts on a fresh line
+                f.truncate(offset)
+            f.write(data)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        if offset == 0:
+            self._sync_dir(self.base_dir)
+        self._journal_position = (stat.st_ino, offset + len(data))
+        self._journal_entries += len(changes)
+        
+        if self._journal_entries >= INDEX_JOURNAL_COMPACT:
+            self._write_index()
+    
+    def _index_file_signature(self) -> Optional[tuple]:
+        """(mtime_ns, size, inode) of index.json, or None if it is missing"""
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    def _write_index(self):
+        """
+        Write the whole in-memory index to index.json and empty the journal
+        
+        Callers hold the "index" lock and loaded the index under it, so the
+        file written contains every other process's changes too. A new
+        generation is written first, so a crash before the journal is
+        removed leaves lines readers already skip.
+        """
+        if self._batch.depth:
+            self._batch.index_dirty = True
+            return
+        
+        self._index_generation = uuid.uuid4().hex
+        data = {
+            "version": INDEX_VERSION,
+            "generation": self._index_generation,
+            "entries": self._index,
+            "stats": self._stats
+        }
+        serializer = "compact" if self.serializer == "pretty" else self.serializer
+        self._atomic_write(self.index_path, dumps_record(data, serializer))
+        self._index_signature = self._index_file_signature()
+        if self.index_journal_path.exists():
+            self.index_journal_path.unlink()
+        self._journal_position = None
+        self._journal_entries = 0
+    
+    def _update_index(self, content: Dict, file_path: Path):
+        """Record a freshly written content file in the index"""
+        status = "draft" if file_path.parent == self.drafts_dir else "published"
+        entry = self._index_entry(content, status, file_path.stat())
+        with self._index_write_lock():
+            self._load_index()
+            self._apply_index_change(content["content_id"], entry)
+            if not self._batch.depth:
+                self._append_index_journal({content["content_id"]: entry})
+    
+    def _remove_from_index(self, content_id: str):
+        """Drop a deleted content item from the index"""
+        with self._index_write_lock():
+            if content_id in self._load_index():
+                self._apply_index_change(content_id, None)
+                if not self._batch.depth:
+                    self._append_index_journal({content_id: None})
+    
+    @contextmanager
+    def _index_write_lock(self):
+        """
+        Hold the locks for changing the index
+        
+        Inside this thread's batch() changes stay in memory until the batch
+        ends, so only the final write takes the cross-process "index" lock.
+        """
+        with self._state_lock:
+            if self._batch.depth:
+                yield
+            else:
+                with self._record_lock("index"):
+                    yield
+    
+    def _apply_index_change(self, content_id: str, entry: Optional[Dict]):
+        """Set (or with entry=None, remove) one index entry, remembering it for the end of a batch"""
+        self._set_index_entry(content_id, entry)
+        if self._batch.depth:
+            self._batch.index[content_id] = entry
+            self._unflushed[content_id] = entry
+    
+    def _set_index_entry(self, content_id: str, entry: Optional[Dict]):
+        """Set (or with entry=None, remove) one index entry, keeping counters and lookups in step"""
+        index = self._index
+        old_entry = index.pop(content_id, None)
+        self._count_entry(old_entry, -1)
+        self._link_entry(old_entry, False)
+        if entry is not None:
+            self._count_entry(entry, 1)
+            self._link_entry(entry, True)
+            index[content_id] = entry
+    
+    def _secondary_indexes(self):
+        """Make sure the slug, category and tag indexes are built and current"""
+        with self._state_lock:
+            if self._by_slug is None:
+                self._reconcile_index()
+            else:
+                # Applies index changes other managers saved since the last lookup
+                self._load_index()
+    
+    def _indexed_ids(self, mapping: str, key: str) -> set:
+        """
+        IDs filed under key in one of the secondary indexes
+        
+        Args:
+            mapping: "_by_slug", "_by_category" or "_by_tag"
+            key: Slug, category or tag
+        """
+        with self._state_lock:
+            self._secondary_indexes()
+            return set(getattr(self, mapping).get(key, ()))
+    
+    def _build_secondary_indexes(self, entries: Iterable[Dict]):
+        """Rebuild the slug, category and tag indexes from index entries"""
+        self._by_slug = {}
+        self._by_category = {}
+        self._by_tag = {}
+        for entry in entries:
+            self._link_entry(entry, True)
+    
+    def _link_entry(self, entry: Optional[Dict], add: bool):
+        """Add or remove one index entry in the slug, category and tag indexes"""
+        if entry is None or self._by_slug is None:
+            return
+        
+        content_id = entry["content_id"]
+        keys = [(self._by_slug, entry.get("slug")), (self._by_category, entry.get("category"))]
+        keys += [(self._by_tag, tag) for tag in entry.get("tags") or []]
+        
+        for mapping, key in keys:
+            if key is None:
+                continue
+            if add:
+                mapping.setdefault(key, set()).add(content_id)
+            elif key in mapping:
+                mapping[key].discard(content_id)
+                if not mapping[key]:
+                    del mapping[key]
+    
+    def _slug_owners(self, slug: str) -> set:
+        """IDs of content currently using a slug"""
+        return self._indexed_ids("_by_slug", slug)
+    
+    def _count_entry(self, entry: Optional[Dict], sign: int):
+        """Add (sign=1) or remove (sign=-1) one index entry from the stats counters"""
+        if entry is None or self._stats is None:
+            return
+        
+        stats = self._stats
+        key = "drafts" if entry["status"] == "draft" else "published"
+        stats[key] += sign
+        stats["total_content"] += sign
+        if entry["status"] == "published":
+            stats["total_views"] += sign * entry.get("total_views", 0)
+        
+        category = entry.get("category") or "Uncategorized"
+        count = stats["categories"].get(category, 0) + sign
+        if count > 0:
+            stats["categories"][category] = count
+        else:
+            stats["categories"].pop(category, None)
+    
+    def _reconcile_index(self) -> Dict[str, Dict]:
+        """
+        Bring the index in line with the files on disk
+        
+        Only files whose mtime or size differ from their index entry are
+        re-read, so an unchanged tree costs one stat per file.
+        
+        Returns:
+            The reconciled index
+        """
+        with self._state_lock, self._record_lock("index"):
+            index = self._load_index()
+            changed = False
+            seen = set()
+            
+            # Published is scanned last so it wins if an id exists in both
+            for status, directory in [("draft", self.drafts_dir), ("published", self.published_dir)]:
+                with os.scandir(directory) as it:
+                    for dir_entry in it:
+                        if not dir_entry.name.endswith(".json"):
+                            continue
+                        content_id = dir_entry.name[:-len(".json")]
+                        stat = dir_entry.stat()
+                        seen.add(content_id)
+                        
+                        entry = index.get(content_id)
+                        if (entry is not None and entry["status"] == status
+                                and entry["mtime_ns"] == stat.st_mtime_ns
+                                and entry["size"] == stat.st_size):
+                            continue
+                        if entry is not None and entry["status"] == "published" and status == "draft":
+                            # Leftover draft of published content; keep published entry
+                            if (self.published_dir / dir_entry.name).exists():
+                                continue
+                        
+                        with open(dir_entry.path, 'rb') as f:
+                            content = self._parse_record(f.read())
+                        index[content_id] = self._index_entry(content, status, stat)
+                        changed = True
+            
+            for content_id in [cid for cid in index if cid not in seen]:
+                del index[content_id]
+                changed = True
+            
+            if changed or self._stats is None:
+                self._stats = self._compute_stats(index.values())
+                self._write_index()
+            
+            if changed or self._by_slug is None:
+                self._build_secondary_indexes(index.values())
+            
+            return index
+    
+    def _generate_slug(self, title: str, content_id: Optional[str] = None) -> str:
+        """
+        Generate URL-friendly slug from title
+        
+        Slugs are unique: if another content item already uses the slug,
+        a numeric suffix is added ("my-post-2", "my-post-3", ...). Callers
+        that save the content should hold _slug_lock() until they have.
+        
+        Args:
+            title: Content title
+            content_id: ID of the content the slug is for, so it can keep its own slug
+            
+        Returns:
+            Slug string
+        """
+        slug = slugify(title)
+        
+        with self._slug_lock():
+            candidate = slug
+            suffix = 2
+            while self._slug_owners(candidate) - {content_id}:
+                candidate = f"{slug}-{suffix}"
+                suffix += 1
+        
+        return candidate
     
     def _generate_meta_description(self, content: str, max_length: int = 155) -> str:
         """
@@ -309,25 +2201,7 @@ class ContentManager:
         Returns:
             Meta description string
         """
-        # Remove markdown/HTML formatting
-        import re
-        clean_content = re.sub(r'[#*`\[\]()<>]', '', content)
-        
-        # Get first paragraph or first max_length characters
-        lines = clean_content.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if len(line) > 50:  # Skip very short lines
-                if len(line) <= max_length:
-                    return line
-                else:
-                    # Truncate at word boundary
-                    truncated = line[:max_length].rsplit(' ', 1)[0]
-                    return truncated + "..."
-        
-        # Fallback: just truncate
-        return clean_content[:max_length].rsplit(' ', 1)[0] + "..."
+        return meta_description(content, max_length)
     
     def _generate_summary(self, content: str, max_sentences: int = 3) -> str:
         """
@@ -340,45 +2214,43 @@ class ContentManager:
         Returns:
             Summary string
         """
-        import re
-        
-        # Remove markdown/HTML formatting
-        clean_content = re.sub(r'[#*`\[\]()<>]', '', content)
-        
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', clean_content)
+        return summarize(content, max_sentences)
+    
+    def get_stats(self, refresh: bool = False) -> Dict:
+        """
+        Get content statistics
         
-        # Get first few meaningful sentences
-        summary_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 30:  # Skip very short sentences
-                summary_sentences.append(sentence)
-                if len(summary_sentences) >= max_sentences:
-                    break
+        Counters are kept up to date by every save and delete, so this is
+        O(1) between reconciliations. Files changed outside this manager
+        are picked up on the next listing or with refresh=True.
         
-        return '. '.join(summary_sentences) + '.'
+        Args:
+            refresh: Reconcile the index with the files on disk first
+            
+        Returns:
+            Totals, per-status counts, published view sum and category breakdown
+        """
+        with self._state_lock:
+            self._load_index()
+            if refresh or self._stats is None:
+                self._reconcile_index()
+            
+            stats = dict(self._stats)
+            stats["categories"] = dict(self._stats["categories"])
+        return stats
     
-    def get_stats(self) -> Dict:
-        """Get content statistics"""
-        drafts = self.list_content(status="draft")
-        published = self.list_content(status="published")
-        
-        return {
-            "total_content": len(drafts) + len(published),
-            "drafts": len(drafts),
-            "published": len(published),
-            "total_views": sum(c.get("analytics", {}).get("total_views", 0) for c in published),
-            "categories": self._get_category_breakdown(drafts + published)
+    def _compute_stats(self, entries: Iterable[Dict]) -> Dict:
+        """Compute stats counters from index entries in a single pass"""
+        self._stats = {
+            "total_content": 0,
+            "drafts": 0,
+            "published": 0,
+            "total_views": 0,
+            "categories": {}
         }
-    
-    def _get_category_breakdown(self, content_list: List[Dict]) -> Dict:
-        """Get breakdown of content by category"""
-        categories = {}
-        for content in content_list:
-            category = content.get("category", "Uncategorized")
-            categories[category] = categories.get(category, 0) + 1
-        return categories
+        for entry in entries:
+            self._count_entry(entry, 1)
+        return self._stats
 
 
 if __name__ == "__main__":
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Astro Posts Sync
+Keeps content_data and the Astro posts directory in step: changed MDX files are
+imported, published records are exported back as MDX
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from content_importer import IMPORT_EXTENSIONS, TOPIC_CATEGORIES, ContentImporter
+from content_manager import ContentManager
+
+
+POSTS_DIR = "gera-yerem-in/src/content/posts"
+
+# ContentManager category -> Astro `topic` enum (src/content/config.ts)
+CATEGORY_TOPICS = {category: topic for topic, category in TOPIC_CATEGORIES.items()}
+
+SYNC_STATE_VERSION = 1
+
+
+def render_mdx(content: Dict) -> str:
+    """
+    Render a content record as an Astro post
+
+    Frontmatter follows the posts collection schema in src/content/config.ts,
+    in the field order and quoting style the existing posts use, so a post
+    imported and exported again comes back unchanged.
+
+    Raises:
+        ValueError: If the record's category has no Astro topic
+    """
+    topic = CATEGORY_TOPICS.get(content.get("category"))
+    if topic is None:
+        raise ValueError(
+            f"Category '{content.get('category')}' of {content['content_id']} has no Astro topic; "
+            f"expected one of {sorted(CATEGORY_TOPICS)}"
+        )
+
+    def quoted(value) -> str:
+        return json.dumps(value or "", ensure_ascii=False)
+
+    lines = [
+        "---",
+        f"title: {quoted(content['title'])}",
+        f"description: {quoted(content.get('meta_description'))}",
+        f"publishDate: {_date_part(content.get('published_date') or content.get('created_date'))}",
+    ]
+    if content.get("modified_date"):
+        lines.append(f"updatedDate: {_date_part(content['modified_date'])}")
+    lines += [
+        f"author: {quoted(content.get('author') or 'Gera Yeremin')}",
+        f"topic: {quoted(topic)}",
+        f"tags: {json.dumps(content.get('tags') or [], ensure_ascii=False)}",
+        f"featured: {'true' if content.get('featured') else 'false'}",
+        f"draft: {'false' if content['status'] == 'published' else 'true'}",
+        "---",
+    ]
+
+    body = content["content_long"]
+    if not body.startswith("\n"):
+        body = "\n" + body
+    return "\n".join(lines) + "\n" + body
+
+
+def _date_part(value: Optional[str]) -> str:
+    """YYYY-MM-DD from an ISO timestamp"""
+    return (value or datetime.now().isoformat())[:10]
+
+
+class InotifyWatcher:
+    """
+    Linux inotify watch on one directory, through libc
+
+    Use create(), which returns None where inotify is not available so
+    callers can fall back to polling.
+    """
+
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+        if libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), mask) < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.directory = Path(directory)
+
+    @classmethod
+    def create(cls, directory: Path) -> Optional["InotifyWatcher"]:
+        """Watch directory, or return None if inotify is unavailable"""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            return cls(directory)
+        except (OSError, AttributeError):
+            return None
+
+    def read(self, timeout: float, settle: float = 0.2) -> Set[Path]:
+        """
+        Wait for changes
+
+        Args:
+            timeout: Seconds to wait for the first event
+            settle: After an event, keep collecting for this long so an
+                editor's write-rename sequence is reported once
+
+        Returns:
+            Paths of changed or deleted entries (empty on timeout)
+        """
+        changed: Set[Path] = set()
+        wait = timeout
+        while select.select([self._fd], [], [], wait)[0]:
+            data = os.read(self._fd, 64 * 1024)
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if name:
+                    changed.add(self.directory / os.fsdecode(name))
+            wait = settle
+        return changed
+
+    def close(self):
+        """Stop watching"""
+        os.close(self._fd)
+
+
+class ContentSync:
+    """
+    Two-way sync between a ContentManager and an Astro posts directory
+
+    Files flow in through ContentImporter, which re-parses only files whose
+    stat changed since the last run. Published records flow out as MDX;
+    a record is only rendered again when its index entry changed, and only
+    written when the rendered file differs from what is on disk. Exported
+    files are recorded in the import manifest so they are not re-imported.
+    Deleting a post file unpublishes its record (it is kept as a draft).
+    A published post keeps its file (and so its URL) when its slug
+    changes, unless rename_on_slug_change is set.
+    """
+
+    def __init__(
+        self,
+        manager: ContentManager,
+        posts_dir: str = POSTS_DIR,
+        importer: Optional[ContentImporter] = None,
+        rename_on_slug_change: bool = False
+    ):
+        self.manager = manager
+        self.posts_dir = Path(posts_dir).resolve()
+        self.importer = importer or ContentImporter(manager)
+        self.rename_on_slug_change = rename_on_slug_change
+        self.state_path = manager.base_dir / "sync_state.json"
+
+    def sync(self, changed: Optional[Iterable[Path]] = None) -> Dict[str, int]:
+        """
+        Run one sync pass
+
+        Args:
+            changed: Paths reported by a watcher; None checks the whole
+                posts directory against the import manifest
+
+        Returns:
+            Counts of imported, unpublished and exported posts
+        """
+        counts = {"imported": 0, "unpublished": 0, "exported": 0}
+
+        if changed is None:
+            present = [str(path) for path in self.posts_dir.iterdir() if path.suffix in IMPORT_EXTENSIONS]
+            deleted = [
+                path for path in self.importer._load_manifest()
+                if Path(path).parent == self.posts_dir and not os.path.exists(path)
+            ]
+        else:
+            changed = [Path(path) for path in changed if Path(path).suffix in IMPORT_EXTENSIONS]
+            present = [str(path) for path in changed if path.exists()]
+            deleted = [str(path.resolve()) for path in changed if not path.exists()]
+
+        imported: Set[str] = set()
+        if present:
+            result = self.importer.import_paths(present)
+            counts["imported"] = result["created"] + result["updated"]
+            imported.update(self.importer.imported)
+        if deleted:
+            counts["unpublished"] = self._unpublish_deleted(deleted)
+
+        counts["exported"] = self.export_published(imported)
+        return counts
+
+    def export_published(self, imported: Optional[Set[str]] = None) -> int:
+        """
+        Write published records whose MDX is missing or out of date
+
+        Args:
+            imported: Records just imported from their files, which are
+                already up to date and are not rewritten in the
+                exporter's formatting
+
+        Returns:
+            Number of files written
+        """
+        imported = imported or set()
+        state = self._load_state()
+        exported, skipped = state["exported"], state["skipped"]
+        files = self._post_files()
+        written = 0
+        seen = set()
+
+        for entry in self.manager.list_metadata("published"):
+            content_id = entry["content_id"]
+            seen.add(content_id)
+            signature = [entry.get("mtime_ns"), entry.get("size"), entry.get("modified_date")]
+            if content_id in imported or (entry.get("mtime_ns") is not None and exported.get(content_id) == signature):
+                exported[content_id] = signature
+                continue
+            if entry.get("mtime_ns") is not None and skipped.get(content_id) == signature:
+                # Already reported; warn again only once the record changes
+                continue
+
+            content = self.manager.get_content(content_id)
+            if content is None:
+                continue
+            try:
+                text = render_mdx(content)
+            except ValueError as e:
+                print(f"Skipping export: {e}", file=sys.stderr)
+                skipped[content_id] = signature
+                exported.pop(content_id, None)
+                continue
+            skipped.pop(content_id, None)
+
+            # A published post keeps the file it already has, so its URL
+            # stays valid (canonical_url points at it) when the title changes
+            current = files.get(content_id)
+            suffix = Path(current).suffix if current else ".mdx"
+            path = self.posts_dir / f"{content['slug']}{suffix}"
+            if current and not self.rename_on_slug_change:
+                path = Path(current)
+
+            if not path.exists() or path.read_text(encoding="utf-8") != text:
+                self.manager._atomic_write(path, text.encode("utf-8"))
+                self.importer.mark_synced(str(path), content_id)
+                written += 1
+                if current and current != str(path):
+                    self._remove_renamed(current)
+            exported[content_id] = signature
+
+        for records in (exported, skipped):
+            for content_id in [cid for cid in records if cid not in seen]:
+                del records[content_id]
+        self._save_state(state)
+        return written
+
+    def _post_files(self) -> Dict[str, str]:
+        """Existing post file of each record, from the import manifest"""
+        files = {}
+        for path, entry in self.importer._load_manifest().items():
+            if Path(path).parent == self.posts_dir and os.path.exists(path):
+                files[entry["content_id"]] = path
+        return files
+
+    def watch(self, interval: float = 2.0, stop: Optional[threading.Event] = None,
+              on_sync=None):
+        """
+        Sync continuously until stop is set
+
+        Uses inotify on Linux so only the files that changed are looked at,
+        and polls every interval seconds elsewhere. Records edited through
+        ContentManager are picked up at least every interval seconds.
+
+        Args:
+            interval: Polling period, and the longest wait between export passes
+            stop: Event that ends the loop
+            on_sync: Called with the counts of every pass that changed something
+        """
+        stop = stop or threading.Event()
+        watcher = InotifyWatcher.create(self.posts_dir)
+        try:
+            counts = self.sync()
+            while not stop.is_set():
+                if on_sync and any(counts.values()):
+                    on_sync(counts)
+                if watcher is not None:
+                    counts = self.sync(watcher.read(timeout=interval))
+                else:
+                    stop.wait(interval)
+                    counts = self.sync()
+        finally:
+            if watcher is not None:
+                watcher.close()
+
+    def _remove_renamed(self, path: str):
+        """Delete a post file left behind by a slug change, unless it was edited since the last sync"""
+        entry = self.importer._load_manifest().get(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return
+        if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            os.remove(path)
+            self.importer.forget([path])
+
+    def _unpublish_deleted(self, paths: List[str]) -> int:
+        """Move records whose post file was deleted back to drafts"""
+        manifest = self.importer._load_manifest()
+        unpublished = 0
+        for path in paths:
+            entry = manifest.get(path)
+            if entry is None:
+                continue
+            content = self.manager.get_content(entry["content_id"], include_body=False)
+            if content is not None and content["status"] == "published":
+                content["status"] = "draft"
+                self.manager._save_content(content, is_draft=True)
+                self.manager._discard_other_copy(content["content_id"], is_draft=True)
+                unpublished += 1
+        self.importer.forget(paths)
+        return unpublished
+
+    def _load_state(self) -> Dict[str, Dict[str, List]]:
+        """
+        Index signatures of records as of their last export check
+
+        Returns:
+            {"exported": {...}, "skipped": {...}}; skipped records could
+            not be rendered and were already reported
+        """
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != SYNC_STATE_VERSION:
+            data = {}
+        return {"exported": data.get("exported", {}), "skipped": data.get("skipped", {})}
+
+    def _save_state(self, state: Dict[str, Dict[str, List]]):
+        """Write the sync state atomically"""
+        data = json.dumps({"version": SYNC_STATE_VERSION, **state}, indent=2)
+        self.manager._atomic_write(self.state_path, data.encode("utf-8"))
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Sync content_data with the Astro posts directory")
+    parser.add_argument("--base-dir", default="content_data", help="Content store directory")
+    parser.add_argument("--posts-dir", default=POSTS_DIR, help="Astro posts directory")
+    parser.add_argument("--watch", action="store_true", help="Keep syncing until interrupted")
+    parser.add_argument("--interval", type=float, default=2.0, help="Polling period in seconds")
+    parser.add_argument("--rename-on-slug-change", action="store_true",
+                        help="Rename a published post's file when its slug changes")
+    args = parser.parse_args()
+
+    sync = ContentSync(ContentManager(args.base_dir), posts_dir=args.posts_dir,
+                       rename_on_slug_change=args.rename_on_slug_change)
+
+    def report(counts: Dict[str, int]):
+        print(f"Imported {counts['imported']}, unpublished {counts['unpublished']}, "
+              f"exported {counts['exported']}")
+
+    if args.watch:
+        try:
+            sync.watch(interval=args.interval, on_sync=report)
+        except KeyboardInterrupt:
+            pass
+    else:
+        report(sync.sync())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,565 @@
+"""
+SQLite Storage Backend for the Content Management System
+Stores content records in a single WAL-mode database with indexed metadata columns
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from content_manager import ContentManager, LazyContent
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    content_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    slug TEXT,
+    status TEXT NOT NULL,
+    category TEXT,
+    tags TEXT,
+    modified_date TEXT,
+    total_views INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    body TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_content_status ON content (status);
+CREATE INDEX IF NOT EXISTS idx_content_category ON content (category);
+CREATE INDEX IF NOT EXISTS idx_content_slug ON content (slug);
+CREATE INDEX IF NOT EXISTS idx_content_modified ON content (modified_date);
+CREATE INDEX IF NOT EXISTS idx_content_page ON content (modified_date, content_id);
+CREATE TABLE IF NOT EXISTS syndication_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    status TEXT NOT NULL,
+    url TEXT,
+    error TEXT,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_syndication_content ON syndication_events (content_id);
+CREATE TABLE IF NOT EXISTS content_revisions (
+    content_id TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (content_id, revision)
+);
+"""
+
+UPSERT = """
+INSERT INTO content (content_id, title, slug, status, category, tags, modified_date, total_views, data, body)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(content_id) DO UPDATE SET
+    title = excluded.title,
+    slug = excluded.slug,
+    status = excluded.status,
+    category = excluded.category,
+    tags = excluded.tags,
+    modified_date = excluded.modified_date,
+    total_views = excluded.total_views,
+    data = excluded.data,
+    body = COALESCE(excluded.body, content.body)
+"""
+
+METADATA_COLUMNS = "content_id, title, slug, status, category, tags, modified_date, total_views"
+
+
+class SQLiteContentManager(ContentManager):
+    """ContentManager that keeps content records in SQLite instead of JSON files"""
+
+    def __init__(self, base_dir: str = "content_data", db_path: Optional[str] = None):
+        super().__init__(base_dir)
+        self.db_path = Path(db_path) if db_path else self.base_dir / "content.db"
+
+        # One connection per thread, so a transaction never picks up (or
+        # commits) statements another thread ran; SQLite serializes writers
+        self._local = threading.local()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """The calling thread's database connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only the owning thread uses it; close() may run on another thread
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                # Connections of finished threads would otherwise stay open
+                for thread in [thread for thread in self._connections if not thread.is_alive()]:
+                    self._connections.pop(thread).close()
+                self._connections[threading.current_thread()] = conn
+        return conn
+
+    def close(self):
+        """Close every thread's database connection"""
+        with self._connections_lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+
+    def get_content(self, content_id: str, include_body: bool = True) -> Optional[Dict]:
+        """
+        Retrieve content by ID
+
+        Args:
+            content_id: Content ID
+            include_body: Read content_long now, or lazily on first access
+
+        Returns:
+            Content object or None if not found
+        """
+        columns = "data, body" if include_body else "data, NULL"
+        row = self._conn.execute(
+            f"SELECT {columns} FROM content WHERE content_id = ?", (content_id,)
+        ).fetchone()
+        return self._content_from_row(content_id, row, include_body) if row else None
+
+    def list_content(self, status: Optional[str] = None, include_body: bool = True,
+                     workers: int = 1, use_processes: bool = False,
+                     chunk_size: int = 256) -> List[Dict]:
+        """
+        List all content, optionally filtered by status
+
+        Args:
+            status: Filter by status ("draft" or "published"), or None for all
+            include_body: Read each content_long now, or lazily on access
+            workers, use_processes, chunk_size: Accepted for compatibility;
+                a single indexed query is already faster than a worker pool
+
+        Returns:
+            List of content objects, newest first
+        """
+        columns = "content_id, data, body" if include_body else "content_id, data, NULL"
+        query = f"SELECT {columns} FROM content"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY modified_date DESC"
+
+        return [
+            self._content_from_row(row[0], row[1:], include_body)
+            for row in self._conn.execute(query, params)
+        ]
+
+    def iter_content(
+        self,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        since: Optional[Union[str, datetime]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_body: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Iterate over content, newest first, streaming rows from a keyset query
+
+        Args:
+            status: Filter by status ("draft" or "published")
+            category: Filter by category
+            since: Only content modified at or after this time (ISO string or datetime)
+            limit: Maximum number of records to yield
+            cursor: Continue after the record this cursor was taken from
+            include_body: Read content_long now instead of lazily
+
+        Yields:
+            Content objects ordered by modified_date, then content_id, descending
+        """
+        columns = "content_id, data, body" if include_body else "content_id, data, NULL"
+        conditions = []
+        params: list = []
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if category is not None:
+            conditions.append("category = ?")
+            params.append(category)
+        if since is not None:
+            conditions.append("COALESCE(modified_date, '') >= ?")
+            params.append(since.isoformat() if isinstance(since, datetime) else since)
+        if cursor:
+            conditions.append("(COALESCE(modified_date, ''), content_id) < (?, ?)")
+            params.extend(self._parse_cursor(cursor))
+
+        query = f"SELECT {columns} FROM content"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY modified_date DESC, content_id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        for row in self._conn.execute(query, params):
+            yield self._content_from_row(row[0], row[1:], include_body)
+
+    def list_metadata(self, status: Optional[str] = None) -> List[Dict]:
+        """
+        List content metadata without decoding full records
+
+        Args:
+            status: Filter by status ("draft" or "published"), or None for all
+
+        Returns:
+            List of metadata dicts, newest first
+        """
+        query = f"SELECT {METADATA_COLUMNS} FROM content"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY modified_date DESC"
+
+        return [self._metadata_from_row(row) for row in self._conn.execute(query, params)]
+
+    def get_by_slug(self, slug: str, include_body: bool = True) -> Optional[Dict]:
+        """
+        Retrieve content by slug using the slug index
+
+        Args:
+            slug: URL slug
+            include_body: Read content_long now, or lazily on first access
+
+        Returns:
+            Content object or None if no content has this slug
+        """
+        row = self._conn.execute(
+            "SELECT content_id FROM content WHERE slug = ? ORDER BY status = 'published' DESC LIMIT 1",
+            (slug,)
+        ).fetchone()
+        return self.get_content(row[0], include_body=include_body) if row else None
+
+    def list_by_tag(self, tag: str) -> List[Dict]:
+        """
+        List content metadata carrying a tag
+
+        Args:
+            tag: Tag name
+
+        Returns:
+            List of metadata dicts, newest first
+        """
+        columns = ", ".join(f"content.{column.strip()}" for column in METADATA_COLUMNS.split(","))
+        rows = self._conn.execute(
+            f"SELECT {columns} FROM content, json_each(content.tags) "
+            "WHERE json_each.value = ? ORDER BY content.modified_date DESC",
+            (tag,)
+        )
+        return [self._metadata_from_row(row) for row in rows]
+
+    def list_by_category(self, category: str) -> List[Dict]:
+        """
+        List content metadata in a category using the category index
+
+        Args:
+            category: Category name
+
+        Returns:
+            List of metadata dicts, newest first
+        """
+        rows = self._conn.execute(
+            f"SELECT {METADATA_COLUMNS} FROM content WHERE category = ? ORDER BY modified_date DESC",
+            (category,)
+        )
+        return [self._metadata_from_row(row) for row in rows]
+
+    def delete_content(self, content_id: str) -> bool:
+        """
+        Delete content by ID
+
+        Args:
+            content_id: Content ID to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        with self._record_lock(content_id):
+            with self._conn:
+                cursor = self._conn.execute("DELETE FROM content WHERE content_id = ?", (content_id,))
+                self._conn.execute("DELETE FROM syndication_events WHERE content_id = ?", (content_id,))
+                self._conn.execute("DELETE FROM content_revisions WHERE content_id = ?", (content_id,))
+            self._discard_record_lock(content_id)
+
+        self._delete_images(content_id)
+        self.adaptations.invalidate(content_id)
+
+        return cursor.rowcount > 0
+
+    def get_syndication_history(self, content_id: str, platform: Optional[str] = None) -> List[Dict]:
+        """
+        Get every recorded syndication event, oldest first
+
+        Args:
+            content_id: Content ID
+            platform: Only return events for this platform
+
+        Returns:
+            List of events with platform, status, url, error and date
+        """
+        query = "SELECT platform, status, url, error, date FROM syndication_events WHERE content_id = ?"
+        params: tuple = (content_id,)
+        if platform is not None:
+            query += " AND platform = ?"
+            params += (platform,)
+        query += " ORDER BY id"
+
+        return [
+            {"platform": row[0], "status": row[1], "url": row[2], "error": row[3], "date": row[4]}
+            for row in self._conn.execute(query, params)
+        ]
+
+    def compact_syndication_log(self, content_id: str):
+        """Rows are updated in place, so there is no log to compact"""
+
+    def compact_syndication_logs(self) -> int:
+        """Rows are updated in place, so there are no logs to compact"""
+        return 0
+
+    def get_stats(self, refresh: bool = False) -> Dict:
+        """Get content statistics; always current since counts are indexed queries"""
+        counts = dict(self._conn.execute(
+            "SELECT status, COUNT(*) FROM content GROUP BY status"
+        ).fetchall())
+        total_views = self._conn.execute(
+            "SELECT COALESCE(SUM(total_views), 0) FROM content WHERE status = 'published'"
+        ).fetchone()[0]
+        categories = dict(self._conn.execute(
+            "SELECT COALESCE(category, 'Uncategorized'), COUNT(*) FROM content GROUP BY 1"
+        ).fetchall())
+
+        drafts = counts.get("draft", 0)
+        published = counts.get("published", 0)
+
+        return {
+            "total_content": drafts + published,
+            "drafts": drafts,
+            "published": published,
+            "total_views": total_views,
+            "categories": categories
+        }
+
+    def import_records(self, records: Iterable[Dict]) -> int:
+        """
+        Insert or replace many content records in one transaction
+
+        Args:
+            records: Content objects to store
+
+        Returns:
+            Number of records written
+        """
+        rows = [self._row_from_content(content) for content in records]
+        with self._conn:
+            self._conn.executemany(UPSERT, rows)
+        return len(rows)
+
+    def import_history(self, content_id: str, revisions: List[Dict], events: List[Dict]):
+        """
+        Replace the revision history and syndication events of one content item
+
+        Args:
+            content_id: Content ID
+            revisions: Revision entries as stored by the JSON backend, oldest first
+            events: Syndication events, oldest first
+        """
+        with self._conn:
+            self._conn.execute("DELETE FROM content_revisions WHERE content_id = ?", (content_id,))
+            self._conn.execute("DELETE FROM syndication_events WHERE content_id = ?", (content_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO content_revisions (content_id, revision, entry) VALUES (?, ?, ?)",
+                [(content_id, entry["revision"], json.dumps(entry, ensure_ascii=False)) for entry in revisions]
+            )
+            self._conn.executemany(
+                "INSERT INTO syndication_events (content_id, platform, status, url, error, date) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(content_id, e["platform"], e["status"], e.get("url"), e.get("error"), e["date"]) for e in events]
+            )
+
+    def _save_content(self, content: Dict, is_draft: bool = True) -> Dict:
+        """Save content row and its revision entry; drafts and published share one table"""
+        with self._record_lock(content["content_id"]):
+            saved = self._check_revision(content)
+            with self._conn:
+                self._conn.execute(UPSERT, self._row_from_content(saved))
+                self._record_revision(saved)
+        return saved
+
+    def _stored_revision(self, content_id: str) -> int:
+        """Revision of the stored row, 0 if it does not exist yet"""
+        row = self._conn.execute(
+            "SELECT COALESCE(json_extract(data, '$.revision'), 0) FROM content WHERE content_id = ?",
+            (content_id,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _append_revision(self, content_id: str, entry: Dict):
+        """Insert a revision entry; runs inside the _save_content transaction"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO content_revisions (content_id, revision, entry) VALUES (?, ?, ?)",
+            (content_id, entry["revision"], json.dumps(entry, ensure_ascii=False))
+        )
+
+    def _read_revisions(self, content_id: str) -> List[Dict]:
+        """Revision entries, oldest first"""
+        rows = self._conn.execute(
+            "SELECT entry FROM content_revisions WHERE content_id = ? ORDER BY revision", (content_id,)
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def _append_syndication_events(self, content_id: str, events: List[Dict]):
+        """Record events and update the stored status in one transaction"""
+        with self._conn:
+            row = self._conn.execute(
+                "SELECT data FROM content WHERE content_id = ?", (content_id,)
+            ).fetchone()
+            metadata = json.loads(row[0])
+            syndication_status = metadata.setdefault("syndication_status", {})
+            for event in events:
+                syndication_status[event["platform"]] = {
+                    "status": event["status"],
+                    "url": event["url"],
+                    "date": event["date"],
+                    "error": event["error"]
+                }
+
+            self._conn.execute(
+                "UPDATE content SET data = ? WHERE content_id = ?",
+                (json.dumps(metadata, ensure_ascii=False), content_id)
+            )
+            self._conn.executemany(
+                "INSERT INTO syndication_events (content_id, platform, status, url, error, date) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(content_id, e["platform"], e["status"], e["url"], e["error"], e["date"]) for e in events]
+            )
+
+    def _refresh_slugs(self):
+        """Slugs are read from the database, which is always current"""
+
+    def _slug_owners(self, slug: str) -> set:
+        """IDs of content currently using a slug"""
+        rows = self._conn.execute("SELECT content_id FROM content WHERE slug = ?", (slug,))
+        return {row[0] for row in rows}
+
+    def _record_exists(self, content_id: str) -> bool:
+        """Whether a row exists for content_id"""
+        return self._conn.execute(
+            "SELECT 1 FROM content WHERE content_id = ?", (content_id,)
+        ).fetchone() is not None
+
+    def _read_body(self, content_id: str, body_ref: Optional[str] = None) -> str:
+        """Read content_long for one row; bodies live in the row, never in the blob store"""
+        row = self._conn.execute(
+            "SELECT body FROM content WHERE content_id = ?", (content_id,)
+        ).fetchone()
+        return row[0] if row and row[0] is not None else ""
+
+    def _content_from_row(self, content_id: str, row: tuple, include_body: bool) -> Dict:
+        """Map a (data, body) row to a content object"""
+        data, body = row
+        metadata = json.loads(data)
+        if "content_long" in metadata:
+            # Rows migrated before bodies had their own column
+            return metadata
+        if include_body:
+            metadata["content_long"] = body if body is not None else ""
+            return metadata
+        return LazyContent(metadata, body_loader=lambda: self._read_body(content_id))
+
+    def _row_from_content(self, content: Dict) -> tuple:
+        """Map a content object to table columns; an unloaded lazy body maps to NULL"""
+        metadata = {key: value for key, value in dict.items(content) if key not in ("content_long", "body_ref")}
+        body = content["content_long"] if dict.__contains__(content, "content_long") else None
+        return (
+            content["content_id"],
+            content["title"],
+            content.get("slug"),
+            content["status"],
+            content.get("category"),
+            json.dumps(content.get("tags", []), ensure_ascii=False),
+            content.get("modified_date"),
+            content.get("analytics", {}).get("total_views", 0),
+            json.dumps(metadata, ensure_ascii=False),
+            body
+        )
+
+    def _metadata_from_row(self, row: tuple) -> Dict:
+        """Map a metadata query row to a dict"""
+        content_id, title, slug, status, category, tags, modified_date, total_views = row
+        return {
+            "content_id": content_id,
+            "title": title,
+            "slug": slug,
+            "status": status,
+            "category": category,
+            "tags": json.loads(tags) if tags else [],
+            "modified_date": modified_date,
+            "total_views": total_views
+        }
+
+
+def migrate_json_to_sqlite(base_dir: str = "content_data", db_path: Optional[str] = None) -> int:
+    """
+    Import an existing JSON content tree into the SQLite backend
+
+    Records are copied along with their revision logs (revisions/*.jsonl)
+    and syndication events (syndication/*.history.jsonl, then the live
+    *.log.jsonl). Running it again replaces what an earlier run imported.
+
+    Args:
+        base_dir: Directory holding drafts/ and published/ JSON files
+        db_path: Target database (defaults to <base_dir>/content.db)
+
+    Returns:
+        Number of records imported
+    """
+
+    manager = SQLiteContentManager(base_dir, db_path=db_path)
+    json_manager = ContentManager(base_dir)
+    content_ids = []
+
+    def read_records():
+        # Drafts first so a published copy of the same id wins the upsert
+        for directory in [json_manager.drafts_dir, json_manager.published_dir]:
+            for file_path in sorted(directory.glob("*.json")):
+                content = json_manager._load_record(file_path)
+                content_ids.append(content["content_id"])
+                yield content
+
+    try:
+        count = manager.import_records(read_records())
+        for content_id in dict.fromkeys(content_ids):
+            events = (json_manager._read_events(json_manager._syndication_history_path(content_id))
+                      + json_manager._read_events(json_manager._syndication_log_path(content_id)))
+            manager.import_history(content_id, json_manager._read_revisions(content_id), events)
+        return count
+    finally:
+        manager.close()
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="SQLite content storage tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate = subparsers.add_parser("migrate", help="Import the JSON content tree into SQLite")
+    migrate.add_argument("--base-dir", default="content_data", help="JSON content directory")
+    migrate.add_argument("--db", default=None, help="Database path (default: <base-dir>/content.db)")
+
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        count = migrate_json_to_sqlite(args.base_dir, args.db)
+        print(f"Imported {count} content records into {args.db or Path(args.base_dir) / 'content.db'}")
+
+
+if __name__ == "__main__":
+    main()
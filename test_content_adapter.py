@@ -0,0 +1,34 @@
+"""
+Tests for ContentAdapter._shorten_content cut points
+"""
+
+from content_adapter import ContentAdapter
+
+LIST_POST = (
+    "Channel results from the last quarter are below. " * 8
+    + "\n\n1. Email converts best\n2. Search converts well\n3. Social converts worst of all the channels we measured"
+)
+
+
+def test_shorten_does_not_end_on_list_number():
+    adapter = ContentAdapter()
+    # Every target whose final fifth reaches into the list
+    for target in range(60, 85):
+        shortened = adapter._shorten_content(LIST_POST, target)
+        last_line = shortened.rstrip(".").rstrip().splitlines()[-1]
+        assert not last_line.strip(" *_.").isdigit(), (target, shortened[-40:])
+
+
+def test_shorten_does_not_end_on_bold_list_number():
+    adapter = ContentAdapter()
+    post = LIST_POST.replace("\n3. ", "\n**3.** ")
+    for target in range(60, 85):
+        shortened = adapter._shorten_content(post, target)
+        last_line = shortened.rstrip(".").rstrip().splitlines()[-1]
+        assert not last_line.strip(" *_.").isdigit(), (target, shortened[-40:])
+
+
+def test_shorten_still_cuts_at_sentence_end():
+    adapter = ContentAdapter()
+    shortened = adapter._shorten_content(LIST_POST, 40)
+    assert shortened.endswith("below.")
@@ -0,0 +1,113 @@
+"""
+Text Processing Helpers
+Slugs, meta descriptions and summaries built from precompiled patterns, reading
+only as much of a document as the result needs
+"""
+
+import re
+from typing import Iterator
+
+# Markdown/HTML characters dropped from descriptions and summaries
+MARKUP_CHARS = re.compile(r'[#*`\[\]()<>]')
+
+SENTENCE_END = re.compile(r'[.!?]+')
+
+SLUG_INVALID = re.compile(r'[^\w\s-]')
+SLUG_SEPARATORS = re.compile(r'[\s_]+')
+SLUG_EDGE_HYPHENS = re.compile(r'^-+|-+$')
+
+
+def clean_markup(text: str) -> str:
+    """Remove markdown/HTML formatting characters"""
+    return MARKUP_CHARS.sub('', text)
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """Yield lines one at a time, like text.split('\n') without splitting it all up front"""
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """
+    Yield the pieces between runs of sentence punctuation
+
+    Matches re.split(r'[.!?]+', text) piece for piece, but scans the text
+    only as far as the caller keeps iterating.
+    """
+    start = 0
+    for match in SENTENCE_END.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
+
+def slugify(title: str) -> str:
+    """
+    Convert a title to a URL-friendly slug
+
+    Args:
+        title: Content title
+
+    Returns:
+        Lowercase slug with hyphens between words
+    """
+    slug = title.lower()
+    slug = SLUG_INVALID.sub('', slug)
+    slug = SLUG_SEPARATORS.sub('-', slug)
+    return SLUG_EDGE_HYPHENS.sub('', slug)
+
+
+def meta_description(content: str, max_length: int = 155) -> str:
+    """
+    Build a meta description from the first substantial line of content
+
+    Args:
+        content: Full content text
+        max_length: Maximum length for meta description
+
+    Returns:
+        Meta description string
+    """
+    # Formatting characters are never newlines, so cleaning line by line
+    # gives the same lines as cleaning the whole text first
+    for line in iter_lines(content):
+        line = clean_markup(line).strip()
+        if len(line) > 50:  # Skip very short lines
+            if len(line) <= max_length:
+                return line
+            # Truncate at word boundary
+            return line[:max_length].rsplit(' ', 1)[0] + "..."
+
+    # Fallback: just truncate
+    return clean_markup(content)[:max_length].rsplit(' ', 1)[0] + "..."
+
+
+def summarize(content: str, max_sentences: int = 3) -> str:
+    """
+    Build a summary from the first meaningful sentences of content
+
+    Args:
+        content: Full content text
+        max_sentences: Number of sentences to include
+
+    Returns:
+        Summary string
+    """
+    summary_sentences = []
+    # Sentence punctuation is never a formatting character, so sentences
+    # can be cleaned one at a time as they are reached
+    for sentence in iter_sentences(content):
+        sentence = clean_markup(sentence).strip()
+        if len(sentence) > 30:  # Skip very short sentences
+            summary_sentences.append(sentence)
+            if len(summary_sentences) >= max_sentences:
+                break
+
+    return '. '.join(summary_sentences) + '.'